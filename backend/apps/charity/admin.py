@@ -1,10 +1,169 @@
+from decimal import Decimal
+from functools import lru_cache
+
+from django import forms
 from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Concat, Length, NullIf, Substr
+from django.forms.models import BaseInlineFormSet
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.html import escape, format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy as _
 from .models import Charity, Campaign, Donation, DonationStatus, CampaignEvent, CampaignEventStatus
 
 
+# Progress bar templates: goal reached, at least half way, under half way.
+# Only the numeric width is interpolated per row.
+_PROGRESS_BARS = tuple(
+    '<div style="width: 100px; height: 20px; background-color: #e9ecef; border-radius: 4px;">'
+    '<div style="width: %s%%; height: 100%%; background-color: ' + color + '; border-radius: 4px;"></div>'
+    "</div>"
+    for color in ("#28a745", "#007bff", "#ffc107")
+)
+
+# Campaign timeline badges, keyed by the _timeline annotation on CampaignAdmin
+_TIMELINE_BADGES = {
+    "upcoming": mark_safe('<span style="color: #6c757d;">📅 Upcoming</span>'),
+    "active": mark_safe('<span style="color: #28a745;">🟢 Active</span>'),
+    "ended": mark_safe('<span style="color: #dc3545;">🔴 Ended</span>'),
+}
+
+
+def _status_badges(styles):
+    """Pre-render the opening ``<span>`` of a status badge for each status"""
+    return {
+        status: mark_safe(f'<span style="color: {color};">{icon} ')
+        for status, (color, icon) in styles.items()
+    }
+
+
+_DONATION_STATUS_BADGES = _status_badges(
+    {
+        DonationStatus.PENDING: ("#ffc107", "⏳"),
+        DonationStatus.COMPLETED: ("#28a745", "✅"),
+        DonationStatus.FAILED: ("#dc3545", "❌"),
+    }
+)
+_EVENT_STATUS_BADGES = _status_badges(
+    {
+        CampaignEventStatus.PENDING: ("#ffc107", "⏳"),
+        CampaignEventStatus.COMPLETED: ("#28a745", "✅"),
+        CampaignEventStatus.CANCELLED: ("#dc3545", "❌"),
+    }
+)
+_UNKNOWN_STATUS_BADGE = mark_safe('<span style="color: #6c757d;">❓ ')
+_BADGE_END = mark_safe("</span>")
+
+
+@lru_cache(maxsize=None)
+def _changelist_url(viewname):
+    return reverse(viewname)
+
+
+@lru_cache(maxsize=None)
+def _change_url_prefix(viewname):
+    # ".../<app>/<model>/0/change/" -> ".../<app>/<model>/"
+    return reverse(viewname, args=["0"]).rsplit("/", 3)[0] + "/"
+
+
+def _change_url(viewname, pk):
+    """Admin change URL for ``pk`` without resolving the URLconf per row"""
+    return f"{_change_url_prefix(viewname)}{pk}/change/"
+
+
+class EstimatedPaginator(Paginator):
+    """
+    Paginator that reads the planner's row estimate for unfiltered changelists
+    instead of running COUNT(*) over the whole table.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::BIGINT FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 (or 0) until the table has been analyzed
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+class ProjectedChangeList(ChangeList):
+    """
+    ChangeList that only SELECTs the model admin's ``list_only_fields``.
+    The change form still loads full rows through ModelAdmin.get_queryset.
+    """
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(*self.model_admin.list_only_fields)
+
+
+class AutocompleteFilter(admin.FieldListFilter):
+    """
+    ForeignKey list filter backed by the admin autocomplete view, so the
+    sidebar only loads the selected object instead of the whole related table.
+    """
+
+    template = "admin/charity/autocomplete_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = "%s__%s__exact" % (field_path, field.target_field.name)
+        self.lookup_val = params.get(self.lookup_kwarg)
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.widget_id = f"autocomplete_filter_{field_path}"
+        self.form_field = forms.ModelChoiceField(
+            queryset=field.remote_field.model._default_manager.all(),
+            widget=AutocompleteSelect(
+                field, model_admin.admin_site, attrs={"id": self.widget_id}
+            ),
+            required=False,
+        )
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg]
+
+    def choices(self, changelist):
+        yield {
+            "selected": self.lookup_val is None,
+            "query_string": changelist.get_query_string(remove=[self.lookup_kwarg]),
+            "display": _("All"),
+        }
+
+    def rendered_widget(self):
+        return self.form_field.widget.render(self.lookup_kwarg, self.lookup_val)
+
+
+class AutocompleteFilterMixin:
+    """Adds the select2/autocomplete assets needed by AutocompleteFilter"""
+
+    @property
+    def media(self):
+        return super().media + AutocompleteSelect(None, self.admin_site).media
+
+
 @admin.register(Charity)
 class CharityAdmin(admin.ModelAdmin):
     list_display = [
@@ -15,7 +174,7 @@ class CharityAdmin(admin.ModelAdmin):
         "on_chain_id",
         "created_at",
     ]
-    list_filter = ["created_at", "updated_at", "on_chain_id"]
+    list_filter = ["created_at", "updated_at"]
     search_fields = ["name", "description", "contact_email", "on_chain_id"]
     readonly_fields = [
         "id",
@@ -48,20 +207,35 @@ class CharityAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _campaigns_count=Count("campaigns"),
+                _total_raised=Coalesce(
+                    Sum("campaigns__raised_amount"), Value(Decimal("0"))
+                ),
+            )
+        )
+
     def campaigns_count(self, obj):
-        count = obj.campaigns.count()
-        url = reverse("admin:charity_campaign_changelist")
+        url = _changelist_url("admin:charity_campaign_changelist")
         return format_html(
-            '<a href="{}?charity__id__exact={}">{} campaigns</a>', url, obj.id, count
+            '<a href="{}?charity__id__exact={}">{} campaigns</a>',
+            url,
+            obj.id,
+            obj._campaigns_count,
         )
 
     campaigns_count.short_description = "Campaigns"
+    campaigns_count.admin_order_field = "_campaigns_count"
 
     def total_raised(self, obj):
-        total = sum([campaign.raised_amount for campaign in obj.campaigns.all()])
-        return f"${total:,.2f}"
+        return f"${obj._total_raised:,.2f}"
 
     total_raised.short_description = "Total Raised"
+    total_raised.admin_order_field = "_total_raised"
 
     def on_chain_id_display(self, obj):
         if obj.on_chain_id:
@@ -72,20 +246,25 @@ class CharityAdmin(admin.ModelAdmin):
 
 
 @admin.register(Campaign)
-class CampaignAdmin(admin.ModelAdmin):
+class CampaignAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = [
         "title",
         "charity_link",
         "goal_amount",
         "raised_amount",
         "progress_bar",
-        "status",
+        "timeline_status",
         "donations_count",
         "on_chain_id",
         "start_date",
         "end_date",
     ]
-    list_filter = ["charity", "start_date", "end_date", "created_at", "on_chain_id"]
+    list_filter = [
+        ("charity", AutocompleteFilter),
+        "start_date",
+        "end_date",
+        "created_at",
+    ]
     search_fields = ["title", "description", "charity__name", "on_chain_id"]
     readonly_fields = [
         "id",
@@ -94,11 +273,24 @@ class CampaignAdmin(admin.ModelAdmin):
         "progress_percentage",
         "donations_count",
         "status",
+        "timeline_status",
         "on_chain_id",
         "transaction_hash",
     ]
     autocomplete_fields = ["charity"]
     date_hierarchy = "start_date"
+    list_select_related = ("charity",)
+    list_only_fields = (
+        "id",
+        "title",
+        "goal_amount",
+        "raised_amount",
+        "on_chain_id",
+        "start_date",
+        "end_date",
+        "charity__id",
+        "charity__name",
+    )
 
     fieldsets = (
         ("Campaign Details", {"fields": ("title", "description", "charity")}),
@@ -106,7 +298,10 @@ class CampaignAdmin(admin.ModelAdmin):
             "Financial Information",
             {"fields": ("goal_amount", "raised_amount", "progress_percentage")},
         ),
-        ("Timeline", {"fields": ("start_date", "end_date", "status")}),
+        (
+            "Timeline",
+            {"fields": ("start_date", "end_date", "status", "timeline_status")},
+        ),
         (
             "Blockchain Details",
             {
@@ -121,67 +316,76 @@ class CampaignAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
+
+    def get_queryset(self, request):
+        # The timeline is worked out in SQL against one timestamp per query;
+        # the ModelAdmin instance is shared between requests, so it can't hold it
+        now = timezone.now()
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _timeline=Case(
+                    When(start_date__gt=now, then=Value("upcoming")),
+                    When(end_date__gte=now, then=Value("active")),
+                    default=Value("ended"),
+                    output_field=CharField(),
+                ),
+                _donations_count=Count(
+                    "donations", filter=Q(donations__status=DonationStatus.COMPLETED)
+                ),
+                _pct=ExpressionWrapper(
+                    F("raised_amount") * Value(Decimal("100")) / NullIf(F("goal_amount"), 0),
+                    output_field=DecimalField(),
+                ),
+            )
+        )
+
     def charity_link(self, obj):
-        url = reverse("admin:charity_charity_change", args=[obj.charity.id])
+        url = _change_url("admin:charity_charity_change", obj.charity_id)
         return format_html('<a href="{}">{}</a>', url, obj.charity.name)
 
     charity_link.short_description = "Charity"
 
     def progress_percentage(self, obj):
-        if obj.goal_amount > 0:
-            percentage = (float(obj.raised_amount) / float(obj.goal_amount)) * 100
-            return f"{percentage:.1f}%"
-        return "0%"
+        return f"{obj._pct or 0:.1f}%"
 
     progress_percentage.short_description = "Progress"
 
     def progress_bar(self, obj):
-        if obj.goal_amount > 0:
-            percentage = min(
-                (float(obj.raised_amount) / float(obj.goal_amount)) * 100, 100
-            )
-            color = (
-                "#28a745"
-                if percentage >= 100
-                else "#007bff" if percentage >= 50 else "#ffc107"
-            )
-            return format_html(
-                '<div style="width: 100px; height: 20px; background-color: #e9ecef; border-radius: 4px;">'
-                '<div style="width: {}%; height: 100%; background-color: {}; border-radius: 4px;"></div>'
-                "</div>",
-                percentage,
-                color,
-            )
+        if obj._pct is not None:
+            percentage = min(obj._pct, 100)
+            template = _PROGRESS_BARS[
+                0 if percentage >= 100 else 1 if percentage >= 50 else 2
+            ]
+            return mark_safe(template % percentage)
         return "-"
 
     progress_bar.short_description = "Progress"
 
     def donations_count(self, obj):
-        count = obj.donations.filter(status=DonationStatus.COMPLETED).count()
-        url = reverse("admin:charity_donation_changelist")
+        url = _changelist_url("admin:charity_donation_changelist")
         return format_html(
-            '<a href="{}?campaign__id__exact={}">{} donations</a>', url, obj.id, count
+            '<a href="{}?campaign__id__exact={}">{} donations</a>',
+            url,
+            obj.id,
+            obj._donations_count,
         )
 
     donations_count.short_description = "Donations"
+    donations_count.admin_order_field = "_donations_count"
 
-    def status(self, obj):
-        from django.utils import timezone
-
-        now = timezone.now()
-
-        if obj.start_date > now:
-            return format_html('<span style="color: #6c757d;">📅 Upcoming</span>')
-        elif obj.start_date <= now <= obj.end_date:
-            return format_html('<span style="color: #28a745;">🟢 Active</span>')
-        else:
-            return format_html('<span style="color: #dc3545;">🔴 Ended</span>')
+    # Not named "status": admin resolves model fields before ModelAdmin methods
+    def timeline_status(self, obj):
+        return _TIMELINE_BADGES[obj._timeline]
 
-    status.short_description = "Status"
+    timeline_status.short_description = "Timeline"
 
 
 @admin.register(Donation)
-class DonationAdmin(admin.ModelAdmin):
+class DonationAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = [
         "user_link",
         "campaign_link",
@@ -194,22 +398,34 @@ class DonationAdmin(admin.ModelAdmin):
     ]
     list_filter = [
         "status",
-        "campaign__charity",
-        "token",
+        ("campaign__charity", AutocompleteFilter),
+        ("token", AutocompleteFilter),
         "donation_timestamp",
         "created_at",
     ]
-    search_fields = [
-        "user__email",
-        "user__name",
-        "campaign__title",
-        "campaign__charity__name",
-        "token__name",
-        "transaction_hash",
-    ]
+    # Served by campaign_title_upper_trgm; transaction hashes are matched
+    # exactly through their unique index in get_search_results()
+    search_fields = ["campaign__title"]
     readonly_fields = ["id", "created_at", "donation_timestamp", "transaction_hash"]
     autocomplete_fields = ["user", "campaign", "token"]
     date_hierarchy = "donation_timestamp"
+    list_select_related = ("user", "campaign", "token")
+    list_only_fields = (
+        "id",
+        "amount",
+        "token_quantity",
+        "status",
+        "donation_timestamp",
+        "user__id",
+        "user__name",
+        "user__email",
+        "campaign__id",
+        "campaign__title",
+        "token__id",
+        "token__name",
+    )
+    paginator = EstimatedPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ("Donation Details", {"fields": ("user", "campaign", "status")}),
@@ -225,50 +441,72 @@ class DonationAdmin(admin.ModelAdmin):
         ("System", {"fields": ("id",), "classes": ("collapse",)}),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if term[:2].lower() == "0x":
+            # Hashes are stored as lowercase 0x-prefixed hex
+            return queryset.filter(transaction_hash=term.lower()), False
+        return super().get_search_results(request, queryset, search_term)
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _txshort=Case(
+                    When(
+                        Q(transaction_hash__isnull=False) & ~Q(transaction_hash=""),
+                        then=Concat(
+                            Substr("transaction_hash", 1, 10),
+                            Value("..."),
+                            Substr(
+                                "transaction_hash", Length("transaction_hash") - 7, 8
+                            ),
+                        ),
+                    ),
+                    default=Value("-"),
+                    output_field=CharField(),
+                )
+            )
+        )
+
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
+
     def user_link(self, obj):
-        url = reverse("admin:users_user_change", args=[obj.user.id])
+        url = _change_url("admin:users_user_change", obj.user_id)
         return format_html('<a href="{}">{}</a>', url, obj.user.name or obj.user.email)
 
     user_link.short_description = "User"
 
     def campaign_link(self, obj):
-        url = reverse("admin:charity_campaign_change", args=[obj.campaign.id])
+        url = _change_url("admin:charity_campaign_change", obj.campaign_id)
         return format_html('<a href="{}">{}</a>', url, obj.campaign.title)
 
     campaign_link.short_description = "Campaign"
 
     def token_link(self, obj):
-        if obj.token:
-            url = reverse("admin:on_chain_token_change", args=[obj.token.id])
+        if obj.token_id:
+            url = _change_url("admin:on_chain_token_change", obj.token_id)
             return format_html('<a href="{}">{}</a>', url, obj.token.name)
         return "-"
 
     token_link.short_description = "Token"
 
     def status_badge(self, obj):
-        colors = {"PENDING": "#ffc107", "COMPLETED": "#28a745", "FAILED": "#dc3545"}
-        icons = {"PENDING": "⏳", "COMPLETED": "✅", "FAILED": "❌"}
-        color = colors.get(obj.status, "#6c757d")
-        icon = icons.get(obj.status, "❓")
-        return format_html(
-            '<span style="color: {};">{} {}</span>',
-            color,
-            icon,
-            obj.get_status_display(),
-        )
+        badge = _DONATION_STATUS_BADGES.get(obj.status, _UNKNOWN_STATUS_BADGE)
+        return badge + escape(obj.get_status_display()) + _BADGE_END
 
     status_badge.short_description = "Status"
 
     def transaction_hash_short(self, obj):
-        if obj.transaction_hash:
-            return f"{obj.transaction_hash[:10]}...{obj.transaction_hash[-8:]}"
-        return "-"
+        return obj._txshort
 
     transaction_hash_short.short_description = "Transaction Hash"
 
 
 @admin.register(CampaignEvent)
-class CampaignEventAdmin(admin.ModelAdmin):
+class CampaignEventAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = [
         "title",
         "campaign_link",
@@ -281,8 +519,8 @@ class CampaignEventAdmin(admin.ModelAdmin):
     ]
     list_filter = [
         "status",
-        "campaign__charity",
-        "created_by",
+        ("campaign__charity", AutocompleteFilter),
+        ("created_by", AutocompleteFilter),
         "event_date",
         "created_at",
     ]
@@ -298,6 +536,21 @@ class CampaignEventAdmin(admin.ModelAdmin):
     autocomplete_fields = ["campaign", "created_by"]
     date_hierarchy = "event_date"
     raw_id_fields = ["campaign", "created_by"]
+    list_select_related = ("campaign", "created_by")
+    list_only_fields = (
+        "id",
+        "title",
+        "amount",
+        "status",
+        "transaction_hash",
+        "event_date",
+        "created_at",
+        "campaign__id",
+        "campaign__title",
+        "created_by__id",
+        "created_by__name",
+        "created_by__email",
+    )
 
     fieldsets = (
         ("Event Details", {"fields": ("title", "description", "campaign")}),
@@ -314,14 +567,17 @@ class CampaignEventAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
+
     def campaign_link(self, obj):
-        url = reverse("admin:charity_campaign_change", args=[obj.campaign.id])
+        url = _change_url("admin:charity_campaign_change", obj.campaign_id)
         return format_html('<a href="{}">{}</a>', url, obj.campaign.title)
 
     campaign_link.short_description = "Campaign"
 
     def created_by_link(self, obj):
-        url = reverse("admin:users_user_change", args=[obj.created_by.id])
+        url = _change_url("admin:users_user_change", obj.created_by_id)
         return format_html(
             '<a href="{}">{}</a>', url, obj.created_by.name or obj.created_by.email
         )
@@ -329,20 +585,8 @@ class CampaignEventAdmin(admin.ModelAdmin):
     created_by_link.short_description = "Created By"
 
     def status_badge(self, obj):
-        colors = {
-            "PENDING": "#ffc107",
-            "COMPLETED": "#28a745",
-            "CANCELLED": "#dc3545",
-        }
-        icons = {"PENDING": "⏳", "COMPLETED": "✅", "CANCELLED": "❌"}
-        color = colors.get(obj.status, "#6c757d")
-        icon = icons.get(obj.status, "❓")
-        return format_html(
-            '<span style="color: {};">{} {}</span>',
-            color,
-            icon,
-            obj.get_status_display(),
-        )
+        badge = _EVENT_STATUS_BADGES.get(obj.status, _UNKNOWN_STATUS_BADGE)
+        return badge + escape(obj.get_status_display()) + _BADGE_END
 
     status_badge.short_description = "Status"
 
@@ -374,6 +618,38 @@ class DonationInline(admin.TabularInline):
     show_change_link = True
 
 
+class LimitedInlineFormSet(BaseInlineFormSet):
+    """Inline formset that only renders the first ``max_rows`` related objects"""
+
+    max_rows = 25
+
+    def get_queryset(self):
+        if not hasattr(self, "_limited_queryset"):
+            self._limited_queryset = super().get_queryset()[: self.max_rows]
+        return self._limited_queryset
+
+
+class LimitedDonationInline(DonationInline):
+    """Read-only view of the most recent donations on the campaign change form"""
+
+    formset = LimitedInlineFormSet
+    readonly_fields = DonationInline.fields
+    raw_id_fields = ["user"]
+    can_delete = False
+    verbose_name_plural = "Recent donations"
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .order_by("-donation_timestamp")
+        )
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 class CampaignEventInline(admin.TabularInline):
     model = CampaignEvent
     extra = 0
@@ -384,7 +660,7 @@ class CampaignEventInline(admin.TabularInline):
 
 # Add inlines to existing admin classes
 CharityAdmin.inlines = [CampaignInline]
-CampaignAdmin.inlines = [DonationInline, CampaignEventInline]
+CampaignAdmin.inlines = [LimitedDonationInline, CampaignEventInline]
 
 # Try to add Token inline to Charity (requires on_chain app)
 try:
@@ -6,6 +6,7 @@ Management command to process existing completed campaign events that don't have
 from django.core.management.base import BaseCommand
 from apps.charity.models import CampaignEvent, CampaignEventStatus
 from apps.charity.signals import handle_campaign_event_status_change
+from apps.charity.tasks import usd_to_cents
 
 
 class Command(BaseCommand):
@@ -18,7 +19,7 @@ class Command(BaseCommand):
         events_to_process = CampaignEvent.objects.filter(
             status=CampaignEventStatus.COMPLETED,
             transaction_hash__isnull=True
-        )
+        ).select_related('campaign')
         
         self.stdout.write(f"Found {events_to_process.count()} events to process")
         
@@ -36,7 +37,7 @@ class Command(BaseCommand):
                 
                 if blockchain_service.is_configured:
                     # Convert amount to cents for blockchain
-                    amount_usd_cents = int(float(event.amount) * 100)
+                    amount_usd_cents = usd_to_cents(event.amount)
                     
                     # Create campaign event on blockchain
                     tx_hash = blockchain_service.create_campaign_event_on_chain(
@@ -46,7 +47,8 @@ class Command(BaseCommand):
                         description=event.description
                     )
                     
-                    # Update the event with transaction hash
+                    # Persist the hash right away so a later failure can't lose it
+                    # and a rerun won't record the event on chain a second time
                     event.transaction_hash = tx_hash
                     event.save(update_fields=['transaction_hash'])
                     
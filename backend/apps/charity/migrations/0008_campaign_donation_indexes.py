@@ -0,0 +1,25 @@
+# Generated by Django 4.2 on 2026-10-15 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0007_add_transaction_hash_to_campaign_event'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', 'start_date', 'end_date'], name='campaign_status_window_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['charity', 'status'], name='campaign_charity_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['campaign', 'status'], name='donation_campaign_status_idx'),
+        ),
+    ]
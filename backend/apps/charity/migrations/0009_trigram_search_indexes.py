@@ -0,0 +1,15 @@
+# Generated by Django 4.2 on 2026-10-15 22:30
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0008_campaign_donation_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ]
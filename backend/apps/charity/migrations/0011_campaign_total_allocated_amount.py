@@ -0,0 +1,42 @@
+# Generated by Django 4.2 on 2026-10-15 22:34
+
+from django.db import migrations, models
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_total_allocated_amount(apps, schema_editor):
+    Campaign = apps.get_model("charity", "Campaign")
+    CampaignEvent = apps.get_model("charity", "CampaignEvent")
+    allocated = (
+        CampaignEvent.objects.filter(
+            campaign=OuterRef("pk"), status__in=["PENDING", "COMPLETED"]
+        )
+        .order_by()
+        .values("campaign")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    Campaign.objects.update(
+        total_allocated_amount=Coalesce(
+            Subquery(allocated), Value(0), output_field=DecimalField()
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0009_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='total_allocated_amount',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.RunPython(
+            populate_total_allocated_amount, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0011_campaign_total_allocated_amount'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(condition=models.Q(('status', 'COMPLETED')), fields=['campaign'], name='donation_completed_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 22:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0012_donation_completed_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', '-created_at'], name='campaign_status_created_idx'),
+        ),
+    ]
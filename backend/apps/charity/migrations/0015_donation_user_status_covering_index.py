@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0014_upper_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['user', 'status', 'donation_timestamp'], include=('amount', 'campaign'), name='don_user_status_ts_cov'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-15 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0015_donation_user_status_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('status__in', ['COMPLETED', 'ENDED'])), fields=['status', 'id'], name='campaign_ended_completed_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-15 22:56
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charity', '0016_campaign_ended_completed_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaignevent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='event_title_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='campaignevent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='event_desc_upper_trgm'),
+        ),
+    ]
@@ -1,8 +1,14 @@
 import uuid
+from decimal import Decimal
+from functools import cached_property
 
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
-from django.db.models import Sum
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Upper
+from django.db.models.lookups import GreaterThanOrEqual
+from django.utils import timezone
 
 from apps.users.models import User
 
@@ -22,10 +28,24 @@ class Charity(models.Model):
         max_length=255, unique=True, null=True, blank=True
     )
 
+    class Meta:
+        # icontains compiles to UPPER(col) LIKE UPPER(...), so the trigram
+        # indexes are on UPPER() for the search filters to use them
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="charity_name_upper_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="charity_desc_upper_trgm",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
-    @property
+    @cached_property
     def charity_explorer_url(self):
         """Generate Sepolia Etherscan URL for charity registration transaction"""
         if self.transaction_hash:
@@ -51,6 +71,10 @@ class Campaign(models.Model):
     description = models.TextField()
     goal_amount = models.DecimalField(max_digits=10, decimal_places=2)
     raised_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    # Running total of PENDING/COMPLETED event amounts, maintained by CampaignEvent
+    total_allocated_amount = models.DecimalField(
+        max_digits=10, decimal_places=2, default=0
+    )
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
     status = models.CharField(
@@ -65,10 +89,38 @@ class Campaign(models.Model):
         max_length=255, unique=True, null=True, blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "start_date", "end_date"],
+                name="campaign_status_window_idx",
+            ),
+            models.Index(fields=["charity", "status"], name="campaign_charity_status_idx"),
+            # Campaigns whose events are visible (CampaignEventViewSet join)
+            models.Index(
+                fields=["status", "id"],
+                name="campaign_ended_completed_idx",
+                condition=Q(status__in=[CampaignStatus.COMPLETED, CampaignStatus.ENDED]),
+            ),
+            # ?status= list filter with the default -created_at ordering
+            models.Index(
+                fields=["status", "-created_at"], name="campaign_status_created_idx"
+            ),
+            # Serve the icontains search filters (see Charity.Meta)
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="campaign_title_upper_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="campaign_desc_upper_trgm",
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
-    @property
+    @cached_property
     def campaign_explorer_url(self):
         """Generate Sepolia Etherscan URL for campaign creation transaction"""
         if self.transaction_hash:
@@ -79,35 +131,70 @@ class Campaign(models.Model):
         """Check if campaign is currently active (not completed or ended)"""
         return self.status in [CampaignStatus.UPCOMING, CampaignStatus.ACTIVE]
 
-    def can_accept_donations(self):
+    def can_accept_donations(self, now=None):
         """Check if campaign can accept new donations"""
-        from django.utils import timezone
-        now = timezone.now()
+        if now is None:
+            now = timezone.now()
         return (
             self.status == CampaignStatus.ACTIVE and
             self.start_date <= now <= self.end_date and
             self.raised_amount < self.goal_amount
         )
 
-    def update_status(self):
-        """Update campaign status based on current time and goal achievement"""
-        from django.utils import timezone
-        from decimal import Decimal
-        now = timezone.now()
-        
+    def compute_status(self, now=None):
+        """Status implied by the current time and goal achievement, without saving"""
+        if now is None:
+            now = timezone.now()
+
         # Use Decimal comparison for precise amount checking
         if Decimal(str(self.raised_amount)) >= Decimal(str(self.goal_amount)):
-            self.status = CampaignStatus.COMPLETED
-        elif now < self.start_date:
-            self.status = CampaignStatus.UPCOMING
-        elif self.start_date <= now <= self.end_date:
-            self.status = CampaignStatus.ACTIVE
-        else:
-            self.status = CampaignStatus.ENDED
-        
-        self.save(update_fields=['status'])
+            return CampaignStatus.COMPLETED
+        if now < self.start_date:
+            return CampaignStatus.UPCOMING
+        if self.start_date <= now <= self.end_date:
+            return CampaignStatus.ACTIVE
+        return CampaignStatus.ENDED
+
+    def update_status(self, now=None):
+        """Update campaign status based on current time and goal achievement"""
+        new_status = self.compute_status(now)
+
+        # Skip the UPDATE when the status hasn't changed
+        if new_status != self.status:
+            self.status = new_status
+            self.save(update_fields=['status'])
         return self.status
 
+    @classmethod
+    def bulk_update_statuses(cls, queryset=None):
+        """
+        Apply the update_status() rules to many campaigns in a single UPDATE.
+        Prefer this over calling update_status() in a loop for batch jobs.
+        Returns the number of campaigns whose status changed.
+        """
+        new_status = cls.status_expression()
+        if queryset is None:
+            queryset = cls.objects.all()
+        return queryset.exclude(status=new_status).update(status=new_status)
+
+    @staticmethod
+    def status_expression(raised_amount=F('raised_amount')):
+        """
+        SQL CASE mirroring update_status(); ``raised_amount`` may be an
+        expression for the value the same UPDATE is about to write.
+        """
+        now = timezone.now()
+        return Case(
+            When(
+                GreaterThanOrEqual(raised_amount, F('goal_amount')),
+                then=Value(CampaignStatus.COMPLETED),
+            ),
+            When(start_date__gt=now, then=Value(CampaignStatus.UPCOMING)),
+            When(end_date__gte=now, then=Value(CampaignStatus.ACTIVE)),
+            default=Value(CampaignStatus.ENDED),
+            output_field=models.CharField(),
+        )
+
     def get_remaining_amount(self):
         """Get the remaining amount needed to reach the goal"""
         return max(0, self.goal_amount - self.raised_amount)
@@ -151,7 +238,38 @@ class Donation(models.Model):
     # Blockchain integration fields
     transaction_hash = models.CharField(max_length=255, null=True, blank=True, unique=True)
 
-    @property
+    class Meta:
+        indexes = [
+            models.Index(fields=["campaign", "status"], name="donation_campaign_status_idx"),
+            # Covers the my_statistics aggregate over a user's completed donations
+            models.Index(
+                fields=["user", "status", "donation_timestamp"],
+                include=["amount", "campaign"],
+                name="don_user_status_ts_cov",
+            ),
+            models.Index(
+                fields=["campaign"],
+                name="donation_completed_idx",
+                condition=Q(status=DonationStatus.COMPLETED),
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the stored row adds to its campaign's raised_amount,
+        # so the signal receivers can apply a delta instead of re-summing
+        if not instance.get_deferred_fields() & {"campaign_id", "amount", "status"}:
+            instance._persisted_contribution = instance.raised_contribution()
+        return instance
+
+    def raised_contribution(self):
+        """Return (campaign_id, amount) this donation adds to raised_amount"""
+        if self.status == DonationStatus.COMPLETED and self.amount is not None:
+            return self.campaign_id, Decimal(str(self.amount))
+        return self.campaign_id, Decimal("0")
+
+    @cached_property
     def donation_explorer_url(self):
         """Generate Sepolia Etherscan URL for donation transaction"""
         if self.transaction_hash:
@@ -165,6 +283,10 @@ class CampaignEventStatus(models.TextChoices):
     CANCELLED = "CANCELLED", "Cancelled"
 
 
+# Event statuses that count towards a campaign's allocated funds
+ALLOCATED_EVENT_STATUSES = (CampaignEventStatus.PENDING, CampaignEventStatus.COMPLETED)
+
+
 class CampaignEvent(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     campaign = models.ForeignKey(
@@ -189,11 +311,37 @@ class CampaignEvent(models.Model):
         ordering = ["-event_date"]
         verbose_name = "Campaign Event"
         verbose_name_plural = "Campaign Events"
+        # Serve the SearchFilter icontains lookups (see Charity.Meta)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="event_title_upper_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="event_desc_upper_trgm",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.campaign.title}"
 
-    @property
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the stored row counts towards, so clean() and save()
+        # don't each query it again (see Donation.from_db)
+        if not instance.get_deferred_fields() & {"campaign_id", "amount", "status"}:
+            instance._loaded_allocation = instance.allocation()
+        return instance
+
+    def allocation(self):
+        """Return (campaign_id, amount) this event adds to total_allocated_amount"""
+        if self.status in ALLOCATED_EVENT_STATUSES:
+            return self.campaign_id, self.amount
+        return None, 0
+
+    @cached_property
     def event_explorer_url(self):
         """Generate Sepolia Etherscan URL for campaign event transaction"""
         if self.transaction_hash:
@@ -215,10 +363,11 @@ class CampaignEvent(models.Model):
         # Check if total allocated amount doesn't exceed raised amount
         # Skip this validation if we're just updating the status to COMPLETED
         if self.campaign_id and self.status != CampaignEventStatus.COMPLETED:
-            total_allocated = CampaignEvent.objects.filter(
-                campaign=self.campaign,
-                status__in=[CampaignEventStatus.PENDING, CampaignEventStatus.COMPLETED]
-            ).exclude(id=self.id).aggregate(total=Sum('amount'))['total'] or 0
+            # Allocation of the other events, from the campaign's running total
+            previous_campaign_id, previous_amount = self._persisted_allocation()
+            total_allocated = self.campaign.total_allocated_amount
+            if previous_campaign_id == self.campaign_id:
+                total_allocated -= previous_amount
             
             if total_allocated + self.amount > self.campaign.raised_amount:
                 raise ValidationError(
@@ -228,15 +377,50 @@ class CampaignEvent(models.Model):
 
     def save(self, *args, **kwargs):
         self.clean()
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            previous_campaign_id, previous_amount = self._persisted_allocation()
+            super().save(*args, **kwargs)
+            amount = self.allocation()[1]
+            if previous_campaign_id not in (None, self.campaign_id):
+                self._adjust_allocated_total(previous_campaign_id, -previous_amount)
+                previous_amount = 0
+            self._adjust_allocated_total(self.campaign_id, amount - previous_amount)
+            self._loaded_allocation = self.allocation()
+
+    def _persisted_allocation(self):
+        """Return (campaign_id, amount) this event currently counts towards in the database"""
+        if self._state.adding:
+            return None, 0
+        if not hasattr(self, "_loaded_allocation"):
+            # Loaded with deferred fields; read the stored row once
+            row = (
+                CampaignEvent.objects.filter(pk=self.pk)
+                .values("campaign_id", "amount", "status")
+                .first()
+            )
+            if row is None or row["status"] not in ALLOCATED_EVENT_STATUSES:
+                self._loaded_allocation = (None, 0)
+            else:
+                self._loaded_allocation = (row["campaign_id"], row["amount"])
+        return self._loaded_allocation
+
+    def _adjust_allocated_total(self, campaign_id, delta):
+        """Apply ``delta`` to a campaign's running allocated total"""
+        if not delta:
+            return
+        Campaign.objects.filter(pk=campaign_id).update(
+            total_allocated_amount=F("total_allocated_amount") + delta
+        )
+        # Keep an already loaded campaign in step with the database
+        if campaign_id == self.campaign_id and CampaignEvent.campaign.is_cached(self):
+            self.campaign.total_allocated_amount += delta
 
     @classmethod
     def get_total_allocated_for_campaign(cls, campaign):
         """Get total allocated amount for a campaign"""
-        return cls.objects.filter(
-            campaign=campaign,
-            status__in=[CampaignEventStatus.PENDING, CampaignEventStatus.COMPLETED]
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        # Running total kept up to date by save() and the post_delete receiver,
+        # so the metric helpers below don't each run their own Sum query
+        return campaign.total_allocated_amount
 
     @classmethod
     def get_remaining_funds_for_campaign(cls, campaign):
@@ -1,10 +1,33 @@
+from copy import copy
+from functools import lru_cache
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Count, Prefetch, Sum
 
 from .models import Charity, Campaign, Donation, DonationStatus, CampaignEvent, CampaignEventStatus
 
 User = get_user_model()
 
+# Bound once so hot serializer paths skip the TextChoices attribute lookup
+_COMPLETED = DonationStatus.COMPLETED
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class and give each instance
+    shallow copies. Only for serializers without nested serializers.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in fields.items()}
+
 
 class CharitySerializer(serializers.ModelSerializer):
     """Serializer for Charity model"""
@@ -17,7 +40,7 @@ class CharitySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Charity
-        fields = [
+        fields = (
             "id",
             "name",
             "description",
@@ -30,8 +53,8 @@ class CharitySerializer(serializers.ModelSerializer):
             "updated_at",
             "campaigns_count",
             "total_raised",
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             "id",
             "on_chain_id",
             "transaction_hash",
@@ -40,29 +63,111 @@ class CharitySerializer(serializers.ModelSerializer):
             "updated_at",
             "campaigns_count",
             "total_raised",
-        ]
+        )
+
+    def _load_campaign_totals(self, obj):
+        """
+        CharityViewSet annotates both campaign aggregates; compute them in a
+        single query for charities that come from elsewhere (e.g. nested).
+        """
+        if not hasattr(obj, "_campaigns_count"):
+            totals = obj.campaigns.aggregate(
+                count=Count("id"), total=Sum("raised_amount")
+            )
+            obj._campaigns_count = totals["count"]
+            obj._total_raised = totals["total"]
 
     def get_campaigns_count(self, obj):
         """Get total number of campaigns for this charity"""
-        return obj.campaigns.count()
+        self._load_campaign_totals(obj)
+        return obj._campaigns_count
 
     def get_total_raised(self, obj):
         """Get total amount raised across all campaigns"""
-        total = sum([campaign.raised_amount for campaign in obj.campaigns.all()])
-        return float(total)
+        self._load_campaign_totals(obj)
+        return float(obj._total_raised or 0)
     
 
 
-class CampaignListSerializer(serializers.ModelSerializer):
+RECENT_DONATIONS_LIMIT = 5
+
+# Columns DonationSerializer reads for a campaign's recent donations
+RECENT_DONATION_FIELDS = (
+    "id",
+    "campaign",
+    "amount",
+    "token_quantity",
+    "status",
+    "transaction_hash",
+    "donation_timestamp",
+    "created_at",
+    "user__email",
+    "user__first_name",
+    "user__last_name",
+    "token__token_id",
+    "token__name",
+    "token__description",
+    "token__value_fiat_lkr",
+    "token__charity__name",
+)
+
+
+def recent_donations_prefetch():
+    """
+    Prefetch for CampaignSerializer.recent_donations; Django applies the
+    slice per campaign, so each campaign gets at most its latest few.
+    """
+    queryset = (
+        Donation.objects.filter(status=_COMPLETED)
+        .select_related("user", "token__charity")
+        .only(*RECENT_DONATION_FIELDS)
+        .order_by("-donation_timestamp")
+    )
+    return Prefetch(
+        "donations",
+        queryset=queryset[:RECENT_DONATIONS_LIMIT],
+        to_attr="_recent_donations",
+    )
+
+
+def _progress_percentage(campaign):
+    """
+    Fundraising progress, preferring the ``progress_pct`` annotation added by
+    annotate_campaign_progress() over Decimal arithmetic on the instance.
+    """
+    if hasattr(campaign, "progress_pct"):
+        return campaign.progress_pct
+    if campaign.goal_amount > 0:
+        return round(float(campaign.raised_amount * 100 / campaign.goal_amount), 2)
+    return 0
+
+
+class ProgressPercentageField(serializers.FloatField):
+    """Read-only fundraising progress for a campaign; see _progress_percentage()"""
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, campaign):
+        return _progress_percentage(campaign)
+
+
+class CampaignListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Campaign list view (minimal fields)"""
 
     charity_name = serializers.CharField(source="charity.name", read_only=True)
-    donations_count = serializers.SerializerMethodField()
-    progress_percentage = serializers.SerializerMethodField()
+    description = serializers.SerializerMethodField()
+    # Read straight from the annotate_campaign_progress() annotations
+    donations_count = serializers.IntegerField(
+        source="completed_donations_count", read_only=True
+    )
+    progress_percentage = ProgressPercentageField()
 
     class Meta:
         model = Campaign
-        fields = [
+        fields = (
             "id",
             "title",
             "description",
@@ -75,17 +180,13 @@ class CampaignListSerializer(serializers.ModelSerializer):
             "donations_count",
             "progress_percentage",
             "created_at",
-        ]
+        )
 
-    def get_donations_count(self, obj):
-        """Get total number of donations for this campaign"""
-        return obj.donations.filter(status=DonationStatus.COMPLETED).count()
-
-    def get_progress_percentage(self, obj):
-        """Calculate fundraising progress percentage"""
-        if obj.goal_amount > 0:
-            return round((float(obj.raised_amount) / float(obj.goal_amount)) * 100, 2)
-        return 0
+    def get_description(self, obj):
+        """Get the description, truncated when the list queryset supplies an excerpt"""
+        if hasattr(obj, "description_excerpt"):
+            return obj.description_excerpt
+        return obj.description
 
 
 class CampaignSerializer(serializers.ModelSerializer):
@@ -94,7 +195,7 @@ class CampaignSerializer(serializers.ModelSerializer):
     charity = CharitySerializer(read_only=True)
     charity_id = serializers.UUIDField(write_only=True)
     donations_count = serializers.SerializerMethodField()
-    progress_percentage = serializers.SerializerMethodField()
+    progress_percentage = ProgressPercentageField()
     recent_donations = serializers.SerializerMethodField()
     total_allocated = serializers.SerializerMethodField()
     remaining_funds = serializers.SerializerMethodField()
@@ -106,7 +207,7 @@ class CampaignSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Campaign
-        fields = [
+        fields = (
             "id",
             "charity",
             "charity_id",
@@ -129,25 +230,30 @@ class CampaignSerializer(serializers.ModelSerializer):
             "remaining_funds",
             "utilization_percentage",
             "events_count",
-        ]
-        read_only_fields = ["id", "raised_amount", "status", "on_chain_id", "transaction_hash", "campaign_explorer_url", "created_at", "updated_at"]
+        )
+        read_only_fields = ("id", "raised_amount", "status", "on_chain_id", "transaction_hash", "campaign_explorer_url", "created_at", "updated_at")
 
     def get_donations_count(self, obj):
         """Get total number of completed donations"""
-        return obj.donations.filter(status=DonationStatus.COMPLETED).count()
-
-    def get_progress_percentage(self, obj):
-        """Calculate fundraising progress percentage"""
-        if obj.goal_amount > 0:
-            return round((float(obj.raised_amount) / float(obj.goal_amount)) * 100, 2)
-        return 0
+        if hasattr(obj, "completed_donations_count"):
+            return obj.completed_donations_count
+        return obj.donations.filter(status=_COMPLETED).count()
 
     def get_recent_donations(self, obj):
         """Get last 5 completed donations"""
-        recent = obj.donations.filter(status=DonationStatus.COMPLETED).order_by(
-            "-donation_timestamp"
-        )[:5]
-        return DonationSerializer(recent, many=True, context=self.context).data
+        # CampaignViewSet prefetches these on retrieve; otherwise run the
+        # LIMIT 5 query, with the campaign attached by the related manager
+        if hasattr(obj, "_recent_donations"):
+            recent = obj._recent_donations
+        else:
+            recent = (
+                obj.donations.filter(status=_COMPLETED)
+                .select_related("user", "token__charity")
+                .only(*RECENT_DONATION_FIELDS)
+                .order_by("-donation_timestamp")[:RECENT_DONATIONS_LIMIT]
+            )
+        serializer = _recent_donation_serializer()
+        return [serializer.to_representation(donation) for donation in recent]
 
     def get_total_allocated(self, obj):
         """Get total allocated amount for this campaign"""
@@ -163,6 +269,8 @@ class CampaignSerializer(serializers.ModelSerializer):
 
     def get_events_count(self, obj):
         """Get total number of events for this campaign"""
+        if hasattr(obj, "_events_count"):
+            return obj._events_count
         return obj.events.count()
     
 
@@ -178,11 +286,7 @@ class CampaignSerializer(serializers.ModelSerializer):
         return data
 
 
-# Import TokenSerializer from on_chain app to avoid duplication
-from apps.on_chain.serializers import TokenSerializer
-
-
-class DonationSerializer(serializers.ModelSerializer):
+class DonationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Donation model"""
 
     user_email = serializers.CharField(source="user.email", read_only=True)
@@ -190,13 +294,13 @@ class DonationSerializer(serializers.ModelSerializer):
     user_last_name = serializers.CharField(source="user.last_name", read_only=True)
     campaign_title = serializers.CharField(source="campaign.title", read_only=True)
     charity_name = serializers.CharField(source="campaign.charity.name", read_only=True)
-    token_details = TokenSerializer(source="token", read_only=True)
+    token_details = serializers.SerializerMethodField()
     transaction_hash = serializers.CharField(read_only=True)
     donation_explorer_url = serializers.ReadOnlyField()
 
     class Meta:
         model = Donation
-        fields = [
+        fields = (
             "id",
             "user",
             "user_email",
@@ -214,8 +318,25 @@ class DonationSerializer(serializers.ModelSerializer):
             "donation_explorer_url",
             "donation_timestamp",
             "created_at",
-        ]
-        read_only_fields = ["id", "transaction_hash", "donation_explorer_url", "donation_timestamp", "created_at"]
+        )
+        read_only_fields = ("id", "transaction_hash", "donation_explorer_url", "donation_timestamp", "created_at")
+
+    def get_token_details(self, obj):
+        """Get the serialized token, shared by the donations of one response"""
+        if obj.token_id is None:
+            return None
+        # Imported here so loading this module doesn't pull in the on_chain
+        # serializers; after the first call this is a sys.modules lookup
+        from apps.on_chain.serializers import TokenSerializer
+
+        # Memoised in the serializer context, which a list's rows share, so
+        # each token is serialized (and its transactions counted) once per
+        # response rather than once per donation
+        tokens = self.context.setdefault("_token_details", {})
+        data = tokens.get(obj.token_id)
+        if data is None:
+            data = tokens[obj.token_id] = TokenSerializer(obj.token).data
+        return data
 
     def validate(self, data):
         """Validate donation data"""
@@ -237,12 +358,21 @@ class DonationSerializer(serializers.ModelSerializer):
     
 
 
+@lru_cache(maxsize=None)
+def _recent_donation_serializer():
+    """
+    Shared DonationSerializer for CampaignSerializer.get_recent_donations.
+    It reads nothing from the context, so one field graph serves every call.
+    """
+    return DonationSerializer()
+
+
 class DonationCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating donations"""
 
     class Meta:
         model = Donation
-        fields = ["campaign", "amount", "token", "token_quantity"]
+        fields = ("campaign", "amount", "token", "token_quantity")
 
     def validate(self, data):
         """Validate donation creation data"""
@@ -269,8 +399,9 @@ class DonationCreateSerializer(serializers.ModelSerializer):
                 "Cannot provide both amount and token_quantity. Choose one donation type."
             )
 
-        # Check if campaign can accept donations
-        if campaign and not campaign.can_accept_donations():
+        # Check if campaign can accept donations; the view may pass the
+        # request time it already used to refresh the campaign status
+        if campaign and not campaign.can_accept_donations(self.context.get("now")):
             if campaign.status == "COMPLETED":
                 raise serializers.ValidationError(
                     "This campaign has reached its funding goal and is no longer accepting donations."
@@ -306,8 +437,8 @@ class DonationCreateSerializer(serializers.ModelSerializer):
                     raise serializers.ValidationError("Invalid token provided for donation")
             
             # Check if donation would exceed the goal
-            if not campaign.can_accept_donation_amount(donation_value):
-                remaining_amount = campaign.get_remaining_amount()
+            remaining_amount = campaign.get_remaining_amount()
+            if donation_value > remaining_amount:
                 raise serializers.ValidationError(
                     f"This donation of ${donation_value:.2f} would exceed the campaign goal. "
                     f"The maximum donation allowed is ${remaining_amount:.2f} to reach the goal of ${campaign.goal_amount}."
@@ -319,21 +450,44 @@ class DonationCreateSerializer(serializers.ModelSerializer):
         """Create donation with current user and set status to completed"""
         validated_data["user"] = self.context["request"].user
         # Set status to COMPLETED since we're not doing actual payment processing
-        validated_data["status"] = DonationStatus.COMPLETED
+        validated_data["status"] = _COMPLETED
         return super().create(validated_data)
 
 
-class CampaignEventListSerializer(serializers.ModelSerializer):
+class EventImageURLMixin:
+    """
+    Absolute ``image_url`` for campaign events. The request's scheme and host
+    are resolved once per serializer instead of once per row.
+    """
+
+    def get_image_url(self, obj):
+        """Get the image URL if available"""
+        if not obj.image:
+            return None
+        request = self.context.get('request')
+        if not request:
+            return None
+        url = obj.image.url
+        if not url.startswith('/') or url.startswith('//'):
+            # Storage already returned an absolute URL
+            return request.build_absolute_uri(url)
+        if not hasattr(self, '_absolute_url_prefix'):
+            self._absolute_url_prefix = request.build_absolute_uri('/')[:-1]
+        return self._absolute_url_prefix + url
+
+
+class CampaignEventListSerializer(EventImageURLMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for CampaignEvent list view (minimal fields)"""
     
-    created_by_name = serializers.SerializerMethodField()
+    # Annotated by annotate_created_by_name() on every queryset listing events
+    created_by_name = serializers.CharField(read_only=True)
     image_url = serializers.SerializerMethodField()
     transaction_hash = serializers.CharField(read_only=True)
     event_explorer_url = serializers.ReadOnlyField()
 
     class Meta:
         model = CampaignEvent
-        fields = [
+        fields = (
             "id",
             "title",
             "description",
@@ -345,22 +499,10 @@ class CampaignEventListSerializer(serializers.ModelSerializer):
             "transaction_hash",
             "event_explorer_url",
             "created_at",
-        ]
+        )
 
-    def get_created_by_name(self, obj):
-        """Get the name of the user who created the event"""
-        return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.email
 
-    def get_image_url(self, obj):
-        """Get the image URL if available"""
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-        return None
-
-
-class CampaignEventSerializer(serializers.ModelSerializer):
+class CampaignEventSerializer(EventImageURLMixin, serializers.ModelSerializer):
     """Serializer for CampaignEvent detail view"""
     
     created_by_name = serializers.SerializerMethodField()
@@ -373,7 +515,7 @@ class CampaignEventSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CampaignEvent
-        fields = [
+        fields = (
             "id",
             "campaign",
             "campaign_title",
@@ -392,34 +534,28 @@ class CampaignEventSerializer(serializers.ModelSerializer):
             "event_explorer_url",
             "created_at",
             "updated_at",
-        ]
-        read_only_fields = ["id", "transaction_hash", "event_explorer_url", "created_at", "updated_at"]
+        )
+        read_only_fields = ("id", "transaction_hash", "event_explorer_url", "created_at", "updated_at")
 
     def get_created_by_name(self, obj):
         """Get the name of the user who created the event"""
+        if hasattr(obj, "created_by_name"):
+            return obj.created_by_name
         return f"{obj.created_by.first_name} {obj.created_by.last_name}".strip() or obj.created_by.email
 
-    def get_image_url(self, obj):
-        """Get the image URL if available"""
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-        return None
-
 
 class CampaignEventCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating campaign events"""
     
     class Meta:
         model = CampaignEvent
-        fields = [
+        fields = (
             "title",
             "description",
             "amount",
             "image",
             "event_date",
-        ]
+        )
 
     def validate(self, data):
         """Validate campaign event creation data"""
@@ -449,8 +585,8 @@ class CampaignEventCreateSerializer(serializers.ModelSerializer):
         # Check if total allocated amount doesn't exceed raised amount
         if amount:
             total_allocated = CampaignEvent.get_total_allocated_for_campaign(campaign)
-            if total_allocated + amount > campaign.raised_amount:
-                remaining = campaign.raised_amount - total_allocated
+            remaining = campaign.raised_amount - total_allocated
+            if amount > remaining:
                 raise serializers.ValidationError(
                     f"Amount exceeds remaining funds. Maximum allocation allowed: ${remaining:.2f}"
                 )
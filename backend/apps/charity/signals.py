@@ -1,8 +1,23 @@
+import logging
+
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.db.models import Sum
+from django.db import transaction
+from django.db.models import F, Sum
 from django.utils import timezone
-from .models import Donation, DonationStatus, Campaign, CampaignStatus, CampaignEvent, CampaignEventStatus
+from .models import (
+    ALLOCATED_EVENT_STATUSES,
+    Donation,
+    DonationStatus,
+    Campaign,
+    CampaignStatus,
+    CampaignEvent,
+    CampaignEventStatus,
+)
+
+from .tasks import create_campaign_event_on_chain
+
+logger = logging.getLogger(__name__)
 
 
 def update_campaign_status_and_amount(campaign):
@@ -18,26 +33,73 @@ def update_campaign_status_and_amount(campaign):
         total=Sum('amount')
     )['total'] or 0
     
-    # Update the campaign's raised_amount
-    campaign.raised_amount = total_raised
-    
     # Update campaign status based on time and goal achievement
     now = timezone.now()
     
-    if campaign.raised_amount >= campaign.goal_amount:
+    if total_raised >= campaign.goal_amount:
         # Goal reached - mark as completed
-        campaign.status = CampaignStatus.COMPLETED
+        new_status = CampaignStatus.COMPLETED
     elif now < campaign.start_date:
         # Campaign hasn't started yet
-        campaign.status = CampaignStatus.UPCOMING
+        new_status = CampaignStatus.UPCOMING
     elif campaign.start_date <= now <= campaign.end_date:
         # Campaign is currently active
-        campaign.status = CampaignStatus.ACTIVE
+        new_status = CampaignStatus.ACTIVE
     else:
         # Campaign has ended
-        campaign.status = CampaignStatus.ENDED
+        new_status = CampaignStatus.ENDED
     
-    campaign.save(update_fields=['raised_amount', 'status'])
+    # update() rather than save() so Campaign's post_save receiver doesn't
+    # run its own status recompute on top of this one
+    fields = {'raised_amount': total_raised, 'status': new_status}
+    Campaign.objects.filter(pk=campaign.pk).update(**fields)
+    for name, value in fields.items():
+        setattr(campaign, name, value)
+
+
+def schedule_campaign_recompute(campaign):
+    """
+    Run update_campaign_status_and_amount() once the current transaction
+    commits, at most once per campaign however many donations change in it.
+    """
+    connection = transaction.get_connection()
+    pending = getattr(connection, 'pending_campaign_recomputes', None)
+    if pending is None:
+        pending = connection.pending_campaign_recomputes = {}
+    pending[campaign.pk] = campaign
+    # Registered on every call: rolling back a savepoint discards the
+    # callbacks registered inside it, and once the first drain has run the
+    # others find nothing left to do. Entries left behind by a rolled back
+    # transaction are recomputed by the next drain, which is harmless
+    transaction.on_commit(lambda: drain_campaign_recomputes(pending))
+
+
+def drain_campaign_recomputes(pending):
+    """Recompute every campaign queued by schedule_campaign_recompute()"""
+    while pending:
+        _, campaign = pending.popitem()
+        update_campaign_status_and_amount(campaign)
+
+
+def apply_campaign_raised_delta(donation, delta, campaign_id=None):
+    """
+    Shift a campaign's raised_amount by ``delta`` and refresh its status in
+    one UPDATE, without re-aggregating all of its donations. The campaign is
+    the donation's own unless ``campaign_id`` is given.
+    """
+    if not delta:
+        return
+    if campaign_id is None:
+        campaign_id = donation.campaign_id
+    raised_amount = F('raised_amount') + delta
+    Campaign.objects.filter(pk=campaign_id).update(
+        raised_amount=raised_amount,
+        status=Campaign.status_expression(raised_amount),
+        updated_at=timezone.now(),
+    )
+    # Keep an already loaded campaign in step with the database
+    if campaign_id == donation.campaign_id and Donation.campaign.is_cached(donation):
+        donation.campaign.refresh_from_db(fields=['raised_amount', 'status', 'updated_at'])
 
 
 @receiver(post_save, sender=Donation)
@@ -46,8 +108,22 @@ def update_campaign_raised_amount_on_save(sender, instance, created, **kwargs):
     Update campaign's raised_amount and status when a donation is created or updated.
     Only count COMPLETED donations.
     """
-    campaign = instance.campaign
-    update_campaign_status_and_amount(campaign)
+    campaign_id, amount = instance.raised_contribution()
+    if created:
+        previous = (campaign_id, 0)
+    else:
+        previous = getattr(instance, '_persisted_contribution', None)
+
+    if previous is None:
+        # Stored contribution unknown: recompute in full
+        schedule_campaign_recompute(instance.campaign)
+    elif previous[0] != campaign_id:
+        # Moved to another campaign: take it off the old one, add it to the new
+        apply_campaign_raised_delta(instance, -previous[1], campaign_id=previous[0])
+        apply_campaign_raised_delta(instance, amount)
+    else:
+        apply_campaign_raised_delta(instance, amount - previous[1])
+    instance._persisted_contribution = (campaign_id, amount)
 
 
 @receiver(post_delete, sender=Donation)
@@ -55,8 +131,11 @@ def update_campaign_raised_amount_on_delete(sender, instance, **kwargs):
     """
     Update campaign's raised_amount and status when a donation is deleted.
     """
-    campaign = instance.campaign
-    update_campaign_status_and_amount(campaign)
+    if instance.get_deferred_fields() & {'amount', 'status'}:
+        schedule_campaign_recompute(instance.campaign)
+    else:
+        _, amount = instance.raised_contribution()
+        apply_campaign_raised_delta(instance, -amount)
 
 
 @receiver(post_save, sender=Campaign)
@@ -81,58 +160,37 @@ def update_campaign_status_on_save(sender, instance, created, **kwargs):
         # Campaign has ended
         new_status = CampaignStatus.ENDED
     
-    # Only save if status actually changed to avoid infinite loops
+    # Write the status with update() so post_save isn't dispatched again
     if new_status != old_status:
+        Campaign.objects.filter(pk=instance.pk).update(status=new_status)
         instance.status = new_status
-        instance.save(update_fields=['status'])
 
 
 @receiver(post_save, sender=CampaignEvent)
 def handle_campaign_event_status_change(sender, instance, created, **kwargs):
     """
     Handle campaign event status changes and trigger blockchain transactions.
-    When status changes to COMPLETED, make on-chain call to create campaign event.
+    When status changes to COMPLETED, queue the on-chain call to create the campaign event.
     """
-    print(f"CampaignEvent signal triggered: created={created}, status={instance.status}, tx_hash={instance.transaction_hash}")
+    logger.debug(
+        "CampaignEvent signal triggered: created=%s, status=%s, tx_hash=%s",
+        created, instance.status, instance.transaction_hash,
+    )
     
     if not created and instance.status == CampaignEventStatus.COMPLETED and not instance.transaction_hash:
-        # Only process if this is a status change to COMPLETED, not a new creation, and no transaction hash yet
-        print(f"Processing campaign event {instance.id} for blockchain transaction")
-        try:
-            from apps.on_chain.blockchain_service import blockchain_service
-            
-            if blockchain_service.is_configured:
-                # Check if campaign has on_chain_id
-                if not instance.campaign.on_chain_id:
-                    print(f"Campaign {instance.campaign.id} not registered on blockchain, skipping event creation")
-                    return
-                
-                # Convert amount to cents for blockchain
-                amount_usd_cents = int(float(instance.amount) * 100)
-                
-                # Create campaign event on blockchain
-                tx_hash = blockchain_service.create_campaign_event_on_chain(
-                    campaign_on_chain_id=instance.campaign.on_chain_id,
-                    amount_usd=amount_usd_cents,
-                    title=instance.title,
-                    description=instance.description
-                )
-                
-                # Update the event with transaction hash using bulk_update to avoid signals
-                from django.db import transaction
-                with transaction.atomic():
-                    CampaignEvent.objects.filter(id=instance.id).update(transaction_hash=tx_hash)
-                
-                print(f"Campaign event {instance.id} created on blockchain with TX {tx_hash}")
-            else:
-                print(f"Blockchain not configured, skipping campaign event {instance.id}")
-                
-        except Exception as e:
-            print(f"Failed to create campaign event on blockchain: {str(e)}")
-            # Log the error for debugging
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Campaign event blockchain transaction failed for {instance.id}: {str(e)}")
-            # Don't change the status back - let admin handle it
+        # Only process if this is a status change to COMPLETED, not a new creation, and no transaction hash yet.
+        # The chain call runs in a Celery task once the event is committed, not in the request
+        logger.debug("Queueing campaign event %s for blockchain transaction", instance.id)
+        event_id = instance.id
+        transaction.on_commit(lambda: create_campaign_event_on_chain.delay(event_id))
 
 
+@receiver(post_delete, sender=CampaignEvent)
+def update_campaign_allocated_amount_on_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted event's amount from its campaign's running allocated total.
+    """
+    if instance.status in ALLOCATED_EVENT_STATUSES:
+        Campaign.objects.filter(pk=instance.campaign_id).update(
+            total_allocated_amount=F('total_allocated_amount') - instance.amount
+        )
@@ -0,0 +1,71 @@
+import logging
+from decimal import Decimal
+
+from celery import shared_task
+
+from .models import CampaignEvent
+
+logger = logging.getLogger(__name__)
+
+
+def usd_to_cents(amount):
+    """Whole USD cents for a Decimal amount, without a float round trip"""
+    return int((Decimal(amount) * 100).quantize(Decimal("1")))
+
+
+@shared_task(bind=True, max_retries=3)
+def create_campaign_event_on_chain(self, event_id):
+    """
+    Record a completed campaign event on the blockchain and store its
+    transaction hash. Queued by the CampaignEvent post_save signal.
+    """
+    from apps.on_chain.blockchain_service import (
+        blockchain_service,
+        BlockchainServiceError,
+        TransactionNotSentError,
+    )
+
+    event = (
+        CampaignEvent.objects.select_related("campaign")
+        .filter(pk=event_id, transaction_hash__isnull=True)
+        .first()
+    )
+    if event is None:
+        # Deleted, or already recorded by an earlier attempt
+        return
+
+    if not blockchain_service.is_configured:
+        logger.debug("Blockchain not configured, skipping campaign event %s", event.id)
+        return
+
+    # Check if campaign has on_chain_id
+    if not event.campaign.on_chain_id:
+        logger.debug("Campaign %s not registered on blockchain, skipping event creation", event.campaign_id)
+        return
+
+    # Convert amount to cents for blockchain
+    amount_usd_cents = usd_to_cents(event.amount)
+
+    try:
+        tx_hash = blockchain_service.create_campaign_event_on_chain(
+            campaign_on_chain_id=event.campaign.on_chain_id,
+            amount_usd=amount_usd_cents,
+            title=event.title,
+            description=event.description
+        )
+    except TransactionNotSentError as e:
+        logger.error("Campaign event blockchain transaction not sent for %s: %s", event.id, e)
+        # Inline (no broker) runs keep the old single-attempt behaviour
+        if self.request.is_eager:
+            return
+        # Nothing was broadcast, so resending cannot duplicate the event
+        raise self.retry(exc=e, countdown=10 * 2 ** self.request.retries)
+    except BlockchainServiceError as e:
+        # The transaction may already be on chain (reverted or receipt timeout);
+        # resending would record the event twice, so leave it for manual follow-up
+        logger.error("Campaign event blockchain transaction failed for %s: %s", event.id, e)
+        return
+
+    # Update the event with transaction hash using update() to avoid signals
+    CampaignEvent.objects.filter(id=event.id).update(transaction_hash=tx_hash)
+    logger.debug("Campaign event %s created on blockchain with TX %s", event.id, tx_hash)
@@ -1,3 +1,414 @@
-from django.test import TestCase
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.mixins import ListModelMixin
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from apps.on_chain.models import OnChainTransaction, Token
+from apps.users.models import User
+from project.renderers import ORJSONRenderer
+
+from . import signals
+from .models import (
+    ALLOCATED_EVENT_STATUSES,
+    Campaign,
+    CampaignEvent,
+    CampaignEventStatus,
+    CampaignStatus,
+    Charity,
+    Donation,
+    DonationStatus,
+)
+
+
+class CharityFixturesMixin:
+    """A donor, a charity and one active campaign"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(
+            username="donor", email="donor@example.com", password="password"
+        )
+        self.charity = Charity.objects.create(
+            name="Charity", description="Description", contact_email="charity@example.com"
+        )
+        self.campaign = self.create_campaign()
+
+    def create_campaign(self, **kwargs):
+        now = timezone.now()
+        fields = {
+            "title": "Campaign",
+            "description": "Description",
+            "goal_amount": Decimal("1000.00"),
+            "start_date": now - timedelta(days=1),
+            "end_date": now + timedelta(days=30),
+        }
+        fields.update(kwargs)
+        return Campaign.objects.create(charity=self.charity, **fields)
+
+    def create_donation(self, **kwargs):
+        fields = {
+            "user": self.user,
+            "campaign": self.campaign,
+            "amount": Decimal("10.00"),
+            "status": DonationStatus.COMPLETED,
+        }
+        fields.update(kwargs)
+        return Donation.objects.create(**fields)
+
+
+class DonationListQueryCountTests(CharityFixturesMixin, APITestCase):
+    """Donation lists must not run extra queries per row"""
+
+    def setUp(self):
+        super().setUp()
+        self.token = Token.objects.create(
+            token_id="TKN", name="Token", value_fiat_lkr=Decimal("1.00"), charity=self.charity
+        )
+        self.client.force_authenticate(self.user)
+        self.add_donations(1)
+
+    def add_donations(self, count):
+        for _ in range(count):
+            self.create_donation(token=self.token)
+
+    def assertQueryCountIndependentOfRows(self, url):
+        with CaptureQueriesContext(connection) as baseline:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.add_donations(4)
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_my_donations(self):
+        self.assertQueryCountIndependentOfRows("/api/donations/")
+
+    def test_charity_donations(self):
+        self.assertQueryCountIndependentOfRows(f"/api/charities/{self.charity.pk}/donations/")
+
+    def test_campaign_donations(self):
+        self.assertQueryCountIndependentOfRows(f"/api/campaigns/{self.campaign.pk}/donations/")
+
+
+class CampaignRaisedAmountTests(CharityFixturesMixin, TestCase):
+    """raised_amount follows the COMPLETED donations through every change"""
+
+    def assertRaisedMatchesDonations(self, *campaigns):
+        for campaign in campaigns:
+            campaign.refresh_from_db()
+            expected = Donation.objects.filter(
+                campaign=campaign, status=DonationStatus.COMPLETED
+            ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
+            self.assertEqual(campaign.raised_amount, expected)
+
+    def test_create(self):
+        self.create_donation()
+        self.create_donation(status=DonationStatus.PENDING)
+        self.assertRaisedMatchesDonations(self.campaign)
+        self.assertEqual(self.campaign.raised_amount, Decimal("10.00"))
+
+    def test_amount_edit(self):
+        donation = self.create_donation()
+        donation.amount = Decimal("25.00")
+        donation.save()
+        self.assertRaisedMatchesDonations(self.campaign)
+        self.assertEqual(self.campaign.raised_amount, Decimal("25.00"))
+
+    def test_status_change_to_completed(self):
+        donation = self.create_donation(status=DonationStatus.PENDING)
+        donation.status = DonationStatus.COMPLETED
+        donation.save()
+        self.assertRaisedMatchesDonations(self.campaign)
+        self.assertEqual(self.campaign.raised_amount, Decimal("10.00"))
+
+    def test_status_change_from_completed(self):
+        donation = self.create_donation()
+        donation.status = DonationStatus.FAILED
+        donation.save()
+        self.assertRaisedMatchesDonations(self.campaign)
+        self.assertEqual(self.campaign.raised_amount, Decimal("0.00"))
+
+    def test_campaign_move(self):
+        other = self.create_campaign(title="Other")
+        donation = self.create_donation()
+        donation.campaign = other
+        donation.save()
+        self.assertRaisedMatchesDonations(self.campaign, other)
+        self.assertEqual(self.campaign.raised_amount, Decimal("0.00"))
+        self.assertEqual(other.raised_amount, Decimal("10.00"))
+
+    def test_reloaded_donation_edit(self):
+        donation = self.create_donation()
+        donation = Donation.objects.get(pk=donation.pk)
+        donation.amount = Decimal("15.00")
+        donation.save()
+        self.assertRaisedMatchesDonations(self.campaign)
+
+    def test_delete(self):
+        self.create_donation()
+        self.create_donation().delete()
+        self.assertRaisedMatchesDonations(self.campaign)
+        self.assertEqual(self.campaign.raised_amount, Decimal("10.00"))
+
+
+class CampaignAllocatedAmountTests(CharityFixturesMixin, TestCase):
+    """total_allocated_amount follows the PENDING/COMPLETED events through every change"""
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        ended = {
+            "start_date": now - timedelta(days=30),
+            "end_date": now - timedelta(days=1),
+            "raised_amount": Decimal("100.00"),
+        }
+        self.campaign = self.create_campaign(**ended)
+        self.other = self.create_campaign(title="Other", **ended)
+        self.assertEqual(self.campaign.status, CampaignStatus.ENDED)
+
+    def create_event(self, **kwargs):
+        fields = {
+            "campaign": self.campaign,
+            "title": "Event",
+            "description": "Description",
+            "amount": Decimal("30.00"),
+            "event_date": timezone.now(),
+            "created_by": self.user,
+        }
+        fields.update(kwargs)
+        return CampaignEvent.objects.create(**fields)
+
+    def assertAllocatedMatchesEvents(self, *campaigns):
+        for campaign in campaigns or (self.campaign, self.other):
+            campaign.refresh_from_db()
+            expected = CampaignEvent.objects.filter(
+                campaign=campaign, status__in=ALLOCATED_EVENT_STATUSES
+            ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
+            self.assertEqual(campaign.total_allocated_amount, expected)
+
+    def test_create(self):
+        self.create_event()
+        self.create_event(status=CampaignEventStatus.CANCELLED)
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("30.00"))
+
+    def test_amount_edit(self):
+        event = self.create_event()
+        event.amount = Decimal("45.00")
+        event.save()
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("45.00"))
+
+    def test_status_changes(self):
+        event = self.create_event()
+        event.status = CampaignEventStatus.CANCELLED
+        event.save()
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("0.00"))
+
+        event.status = CampaignEventStatus.PENDING
+        event.save()
+        event.status = CampaignEventStatus.COMPLETED
+        event.save()
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("30.00"))
+
+    def test_campaign_move(self):
+        event = self.create_event()
+        event.campaign = self.other
+        event.save()
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("0.00"))
+        self.assertEqual(self.other.total_allocated_amount, Decimal("30.00"))
+
+    def test_reloaded_event_edit(self):
+        event = CampaignEvent.objects.get(pk=self.create_event().pk)
+        event.amount = Decimal("20.00")
+        event.save()
+        deferred = CampaignEvent.objects.only("id", "amount").get(pk=event.pk)
+        deferred.amount = Decimal("25.00")
+        deferred.save()
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("25.00"))
+
+    def test_delete(self):
+        self.create_event()
+        self.create_event(amount=Decimal("10.00")).delete()
+        self.create_event(status=CampaignEventStatus.CANCELLED).delete()
+        self.assertAllocatedMatchesEvents()
+        self.assertEqual(self.campaign.total_allocated_amount, Decimal("30.00"))
+
+
+class CampaignRecomputeTests(CharityFixturesMixin, TestCase):
+    """Full raised_amount recomputes are coalesced until commit"""
+
+    def test_recomputes_once_per_campaign_per_transaction(self):
+        for _ in range(3):
+            self.create_donation(status=DonationStatus.PENDING)
+
+        recompute = mock.patch.object(
+            signals,
+            "update_campaign_status_and_amount",
+            wraps=signals.update_campaign_status_and_amount,
+        )
+        with recompute as recompute_mock, self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                # Deferred fields leave the stored contribution unknown, which
+                # takes the full recompute path
+                for donation in Donation.objects.only("id", "campaign"):
+                    donation.status = DonationStatus.COMPLETED
+                    donation.save()
+                recompute_mock.assert_not_called()
+
+        recompute_mock.assert_called_once()
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.raised_amount, Decimal("30.00"))
+
+
+class AllTransactionsTests(CharityFixturesMixin, APITestCase):
+    """all_transactions merges five sources into one sorted, paged UNION"""
+
+    url = "/api/campaigns/all_transactions/"
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        Charity.objects.filter(pk=self.charity.pk).update(
+            transaction_hash="0xcharity", created_at=now - timedelta(hours=5)
+        )
+        campaign = self.create_campaign(
+            title="Funded",
+            start_date=now - timedelta(days=30),
+            end_date=now - timedelta(days=1),
+            raised_amount=Decimal("100.00"),
+            transaction_hash="0xcampaign",
+        )
+        Campaign.objects.filter(pk=campaign.pk).update(created_at=now - timedelta(hours=4))
+        donation = self.create_donation(campaign=campaign, transaction_hash="0xdonation")
+        Donation.objects.filter(pk=donation.pk).update(
+            donation_timestamp=now - timedelta(hours=3)
+        )
+        event = CampaignEvent.objects.create(
+            campaign=campaign,
+            title="Event",
+            description="Description",
+            amount=Decimal("30.00"),
+            event_date=now,
+            created_by=self.user,
+            transaction_hash="0xevent",
+        )
+        CampaignEvent.objects.filter(pk=event.pk).update(created_at=now - timedelta(hours=2))
+        token = Token.objects.create(
+            token_id="TKN", name="Token", value_fiat_lkr=Decimal("1.00"), charity=self.charity
+        )
+        transfer = OnChainTransaction.objects.create(
+            transaction_hash="0xtransfer",
+            token=token,
+            from_address="0xfrom",
+            to_address="0xto",
+            amount=Decimal("5.00000000"),
+        )
+        OnChainTransaction.objects.filter(pk=transfer.pk).update(
+            timestamp=now - timedelta(hours=1)
+        )
+
+    def get(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_newest_first_by_default(self):
+        data = self.get()
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(
+            [row["type"] for row in data["results"]],
+            ["on_chain", "campaign_event", "donation", "campaign_creation", "charity_registration"],
+        )
+        self.assertEqual(
+            [row["transaction_hash"] for row in data["results"]],
+            ["0xtransfer", "0xevent", "0xdonation", "0xcampaign", "0xcharity"],
+        )
+        event = data["results"][1]
+        self.assertEqual(event["event_title"], "Event")
+        self.assertEqual(event["campaign_title"], "Funded")
+        self.assertEqual(event["amount"], 30.0)
+        self.assertEqual(data["results"][0]["token_name"], "Token")
+
+    def test_ordering(self):
+        self.assertEqual(
+            [row["type"] for row in self.get(ordering="created_at")["results"]],
+            ["charity_registration", "campaign_creation", "donation", "campaign_event", "on_chain"],
+        )
+        self.assertEqual(
+            [row["amount"] for row in self.get(ordering="amount")["results"]],
+            [0.0, 5.0, 10.0, 30.0, 1000.0],
+        )
+        self.assertEqual(
+            [row["amount"] for row in self.get(ordering="-amount")["results"]],
+            [1000.0, 30.0, 10.0, 5.0, 0.0],
+        )
+
+    def test_page_is_clamped_to_first(self):
+        first = self.get()
+        for page in ("0", "-1", "abc"):
+            data = self.get(page=page)
+            self.assertEqual(data["count"], 5)
+            self.assertEqual(data["results"], first["results"])
+            self.assertIsNone(data["previous"])
+
+    def test_page_past_the_end(self):
+        data = self.get(page=2)
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(data["results"], [])
+
+
+class CampaignFastListTests(CharityFixturesMixin, APITestCase):
+    """?fast only takes the values() path for a true value"""
+
+    url = "/api/campaigns/"
+
+    def test_fast_values(self):
+        for value in ("1", "true", "True"):
+            with mock.patch.object(ListModelMixin, "list") as stock_list:
+                response = self.client.get(self.url, {"fast": value})
+            self.assertEqual(response.status_code, 200)
+            stock_list.assert_not_called()
+            self.assertEqual([row["id"] for row in response.data], [self.campaign.pk])
+            self.assertEqual(response.data[0]["goal_amount"], "1000.00")
+
+    def test_false_values_use_the_serializer(self):
+        for params in ({}, {"fast": "0"}, {"fast": "false"}, {"fast": ""}):
+            with mock.patch.object(ListModelMixin, "list", return_value=Response([])) as stock_list:
+                response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            stock_list.assert_called_once()
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer must produce the stock JSONRenderer's bytes"""
+
+    def assertRendersLikeStock(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_matches_stock_output(self):
+        self.assertRendersLikeStock({
+            "amount": Decimal("10.50"),
+            "title": gettext_lazy("Campaign"),
+            "results": [{"id": 1, "status": None, "active": True}],
+        })
+
+    def test_escapes_line_separators(self):
+        self.assertRendersLikeStock({"description": "line\u2028break\u2029end"})
+
+    def test_wide_integers(self):
+        self.assertRendersLikeStock({"wei": 2**70})
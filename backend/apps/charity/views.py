@@ -1,14 +1,42 @@
+from decimal import Decimal
+import uuid
+
+from django.conf import settings
 from django.shortcuts import render
-from django.db.models import Q, Sum, F
+from django.db.models import (
+    CharField,
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce, Concat, NullIf, Round, Substr, Trim
 from django.utils import timezone
 from django.db import transaction
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.renderers import BrowsableAPIRenderer
+from web3 import Web3
 import logging
 
-from .models import Charity, Campaign, Donation, DonationStatus, CampaignEvent
+from .models import (
+    Charity,
+    Campaign,
+    CampaignStatus,
+    Donation,
+    DonationStatus,
+    CampaignEvent,
+)
 from .serializers import (
     CharitySerializer,
     CampaignSerializer,
@@ -19,11 +47,159 @@ from .serializers import (
     CampaignEventListSerializer,
     CampaignEventCreateSerializer,
     CampaignUtilizationSerializer,
+    recent_donations_prefetch,
 )
 from apps.on_chain.blockchain_service import blockchain_service, BlockchainServiceError
+from apps.on_chain.models import OnChainTransaction
+from apps.users.permissions import IsCharityManager
+from project.pagination import StandardPagination
+from project.renderers import ORJSONRenderer
 
 logger = logging.getLogger(__name__)
 
+# List cards clamp descriptions to a few lines; longer text is never shown
+CAMPAIGN_LIST_DESCRIPTION_LENGTH = 300
+
+# Donations are mirrored on-chain at $100 = 0.001 ETH
+DONATION_ETH_PER_USD = Decimal("0.00001")
+DONATION_WEI_PER_USD = 10**13
+
+# Renderers for the large donation and event lists; their serializers emit no
+# floats, which ORJSONRenderer would write differently from the stock renderer
+LIST_RENDERER_CLASSES = [ORJSONRenderer, BrowsableAPIRenderer]
+
+# Columns read by CampaignEventListSerializer (created_by_name is annotated)
+CAMPAIGN_EVENT_LIST_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "amount",
+    "image",
+    "event_date",
+    "status",
+    "transaction_hash",
+    "created_at",
+)
+
+# ModelViewSet actions that change data
+WRITE_ACTIONS = frozenset({"create", "update", "partial_update", "destroy"})
+
+# ?status= values accepted by the campaign list
+CAMPAIGN_STATUS_FILTERS = {
+    "active": CampaignStatus.ACTIVE,
+    "upcoming": CampaignStatus.UPCOMING,
+    "ended": CampaignStatus.ENDED,
+    "completed": CampaignStatus.COMPLETED,
+}
+
+
+def annotate_created_by_name(queryset):
+    """Annotate the event creator's display name: full name, else email"""
+    return queryset.annotate(
+        created_by_name=Coalesce(
+            NullIf(
+                Trim(
+                    Concat(
+                        "created_by__first_name", Value(" "), "created_by__last_name"
+                    )
+                ),
+                Value(""),
+            ),
+            "created_by__email",
+            output_field=CharField(),
+        )
+    )
+
+
+def annotate_campaign_progress(queryset):
+    """Annotate the per-campaign aggregates read by the campaign serializers"""
+    return queryset.annotate(
+        completed_donations_count=Count(
+            "donations", filter=Q(donations__status=DonationStatus.COMPLETED)
+        ),
+        progress_pct=Coalesce(
+            Cast(
+                Round(
+                    ExpressionWrapper(
+                        F("raised_amount") * 100 / NullIf(F("goal_amount"), 0),
+                        output_field=DecimalField(),
+                    ),
+                    2,
+                ),
+                FloatField(),
+            ),
+            0.0,
+        ),
+    )
+
+
+# Columns shared by every branch of the all_transactions UNION, in SELECT order
+TRANSACTION_COLUMNS = (
+    "id",
+    "type",
+    "transaction_hash",
+    "amount",
+    "token_quantity",
+    "from_address",
+    "to_address",
+    "charity_name",
+    "campaign_title",
+    "user_email",
+    "timestamp",
+    "status",
+    "event_title",
+    "token_name",
+)
+
+
+def _text(value):
+    return Value(value, output_field=CharField())
+
+
+def _transaction_rows(queryset, type_, id_prefix, **columns):
+    """
+    Project ``queryset`` onto TRANSACTION_COLUMNS for the all_transactions
+    UNION. Every column is an annotation added in the same order, so the
+    SELECT lists of all branches line up.
+    """
+    columns["id"] = Concat(_text(f"{id_prefix}_"), Cast("id", CharField()))
+    columns["type"] = _text(type_)
+    annotations = {
+        f"tx_{name}": columns.get(name, _text("")) for name in TRANSACTION_COLUMNS
+    }
+    return queryset.order_by().annotate(**annotations).values(*annotations)
+
+
+def _unified_transaction(row):
+    """Build the all_transactions response item for a row of the UNION"""
+    type_ = row["tx_type"]
+    transaction_hash = row["tx_transaction_hash"]
+    data = {
+        "id": row["tx_id"],
+        "type": type_,
+        "transaction_hash": transaction_hash,
+        "amount": float(row["tx_amount"]),
+        "token_quantity": float(row["tx_token_quantity"]),
+        "from_address": row["tx_from_address"],
+        "to_address": row["tx_to_address"],
+        "charity_name": row["tx_charity_name"],
+        "campaign_title": row["tx_campaign_title"],
+        "user_email": row["tx_user_email"],
+        "timestamp": row["tx_timestamp"],
+        "status": row["tx_status"],
+        # Same URL the models' *_explorer_url properties build
+        "explorer_url": (
+            f"https://sepolia.etherscan.io/tx/{transaction_hash}"
+            if transaction_hash or type_ == "on_chain"
+            else None
+        ),
+    }
+    if type_ == "campaign_event":
+        data["event_title"] = row["tx_event_title"]
+    elif type_ == "on_chain":
+        data["token_name"] = row["tx_token_name"]
+    return data
+
 
 class CharityViewSet(viewsets.ModelViewSet):
     """
@@ -38,83 +214,123 @@ class CharityViewSet(viewsets.ModelViewSet):
     search_fields = ["name", "description", "contact_email"]
     ordering_fields = ["name", "created_at"]
     ordering = ["-created_at"]
+
+    def get_queryset(self):
+        """Annotate aggregates read by CharitySerializer"""
+        return super().get_queryset().annotate(
+            _campaigns_count=Count("campaigns", distinct=True),
+            _total_raised=Sum("campaigns__raised_amount"),
+        )
     
     def perform_create(self, serializer):
         """Create charity and register it on the blockchain"""
         try:
-            with transaction.atomic():
-                # Save charity to database first
-                charity = serializer.save()
+            # Register on blockchain first (only if blockchain is configured),
+            # so the row is inserted once, already carrying its on-chain fields
+            blockchain_fields = {}
+            if blockchain_service.is_configured:
+                try:
+                    # The id is assigned up front because the metadata URI embeds it
+                    charity_id = uuid.uuid4()
+                    
+                    # Create metadata URI (simplified for now)
+                    metadata_uri = f"https://api.example.com/charities/{charity_id}/metadata"
+                    
+                    # Use admin wallet address for all charity registrations
+                    admin_wallet = getattr(settings, 'ADMIN_WALLET_ADDRESS', '')
+                    
+                    on_chain_id, tx_hash = blockchain_service.register_charity_on_chain(
+                        name=serializer.validated_data["name"],
+                        metadata_uri=metadata_uri,
+                        wallet_address=admin_wallet
+                    )
+                    
+                except BlockchainServiceError as e:
+                    logger.error(f"Failed to register charity on blockchain: {str(e)}")
+                    # Nothing has been written to the database yet
+                    raise Exception(f"Blockchain registration failed: {str(e)}")
                 
-                # Register on blockchain (only if blockchain is configured)
-                from apps.on_chain.blockchain_service import blockchain_service
-                if blockchain_service.is_configured:
-                    try:
-                        # Create metadata URI (simplified for now)
-                        metadata_uri = f"https://api.example.com/charities/{charity.id}/metadata"
-                        
-                        # Use admin wallet address for all charity registrations
-                        from django.conf import settings
-                        admin_wallet = getattr(settings, 'ADMIN_WALLET_ADDRESS', '')
-                        
-                        on_chain_id, tx_hash = blockchain_service.register_charity_on_chain(
-                            name=charity.name,
-                            metadata_uri=metadata_uri,
-                            wallet_address=admin_wallet
-                        )
-                        
-                        # Update charity with blockchain data
-                        charity.on_chain_id = on_chain_id
-                        charity.transaction_hash = tx_hash
-                        charity.save(update_fields=['on_chain_id', 'transaction_hash'])
-                        
-                        logger.info(f"Charity {charity.id} registered on blockchain with ID {on_chain_id}")
-                        
-                    except BlockchainServiceError as e:
-                        logger.error(f"Failed to register charity on blockchain: {str(e)}")
-                        # Rollback database transaction if blockchain fails
-                        raise Exception(f"Blockchain registration failed: {str(e)}")
-                else:
-                    logger.info(f"Charity {charity.id} created without blockchain integration (blockchain not configured)")
+                blockchain_fields = {
+                    "id": charity_id,
+                    "on_chain_id": on_chain_id,
+                    "transaction_hash": tx_hash,
+                }
+            
+            try:
+                with transaction.atomic():
+                    charity = serializer.save(**blockchain_fields)
+            except Exception:
+                if blockchain_fields:
+                    # Leave enough in the log to reconcile the on-chain record
+                    logger.error(
+                        "Charity registered on blockchain with ID %s (TX %s) but not saved",
+                        blockchain_fields["on_chain_id"],
+                        blockchain_fields["transaction_hash"],
+                    )
+                raise
+            
+            if blockchain_fields:
+                logger.info(f"Charity {charity.id} registered on blockchain with ID {charity.on_chain_id}")
+            else:
+                logger.info(f"Charity {charity.id} created without blockchain integration (blockchain not configured)")
                     
         except Exception as e:
             logger.error(f"Failed to create charity: {str(e)}")
             raise
 
-    @action(detail=True, methods=["get"])
+    @action(detail=True, methods=["get"], pagination_class=StandardPagination)
     def campaigns(self, request, pk=None):
         """Get all campaigns for a specific charity"""
         charity = self.get_object()
-        campaigns = charity.campaigns.all()
+        campaigns = annotate_campaign_progress(
+            charity.campaigns.order_by("-created_at")
+        )
+        page = self.paginate_queryset(campaigns)
         serializer = CampaignListSerializer(
-            campaigns, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
-        return Response(serializer.data)
-
-    @action(detail=True, methods=["get"])
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=StandardPagination,
+        renderer_classes=LIST_RENDERER_CLASSES,
+    )
     def donations(self, request, pk=None):
         """Get all donations for a specific charity"""
         charity = self.get_object()
-        donations = Donation.objects.filter(campaign__charity=charity)
+        donations = (
+            Donation.objects.filter(campaign__charity=charity)
+            .select_related("user", "campaign__charity", "token")
+            .order_by("-donation_timestamp")
+        )
+        page = self.paginate_queryset(donations)
         serializer = DonationSerializer(
-            donations, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=True, methods=["get"])
     def statistics(self, request, pk=None):
         """Get statistics for a specific charity"""
         charity = self.get_object()
-        campaigns = charity.campaigns.all()
-
-        total_campaigns = campaigns.count()
-        active_campaigns = campaigns.filter(
-            start_date__lte=timezone.now(), end_date__gte=timezone.now()
-        ).count()
-
-        total_raised = campaigns.aggregate(total=Sum("raised_amount"))["total"] or 0
+        now = timezone.now()
 
-        total_goal = campaigns.aggregate(total=Sum("goal_amount"))["total"] or 0
+        # Donations are counted separately: joining them here would repeat
+        # each campaign row and inflate the sums
+        totals = charity.campaigns.aggregate(
+            total_campaigns=Count("id"),
+            active_campaigns=Count(
+                "id", filter=Q(start_date__lte=now, end_date__gte=now)
+            ),
+            total_raised=Sum("raised_amount"),
+            total_goal=Sum("goal_amount"),
+        )
+        total_campaigns = totals["total_campaigns"]
+        active_campaigns = totals["active_campaigns"]
+        total_raised = totals["total_raised"] or 0
+        total_goal = totals["total_goal"] or 0
 
         completed_donations = Donation.objects.filter(
             campaign__charity=charity, status=DonationStatus.COMPLETED
@@ -125,8 +341,9 @@ class CharityViewSet(viewsets.ModelViewSet):
             "active_campaigns": active_campaigns,
             "total_raised": float(total_raised),
             "total_goal": float(total_goal),
+            # Divide the Decimal sums; only the rounded result becomes a float
             "progress_percentage": (
-                round((float(total_raised) / float(total_goal)) * 100, 2)
+                float(round(total_raised * 100 / total_goal, 2))
                 if total_goal > 0
                 else 0
             ),
@@ -161,52 +378,105 @@ class CampaignViewSet(viewsets.ModelViewSet):
         if self.action == "list":
             return CampaignListSerializer
         return CampaignSerializer
+
+    def list(self, request, *args, **kwargs):
+        """
+        List campaigns. With ``?fast=1`` (or ``true``) the rows are read with
+        values() and returned in the CampaignListSerializer shape without
+        building model instances or running the serializer.
+        """
+        if request.query_params.get("fast", "").lower() not in ("1", "true"):
+            return super().list(request, *args, **kwargs)
+
+        rows = self.filter_queryset(self.get_queryset()).values(
+            "id",
+            "title",
+            "description_excerpt",
+            "goal_amount",
+            "raised_amount",
+            "start_date",
+            "end_date",
+            "status",
+            "charity__name",
+            "completed_donations_count",
+            "progress_pct",
+            "created_at",
+        )
+        data = [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "description": row["description_excerpt"],
+                # DecimalField renders as a string; the JSON encoder would emit floats
+                "goal_amount": str(row["goal_amount"]),
+                "raised_amount": str(row["raised_amount"]),
+                "start_date": row["start_date"],
+                "end_date": row["end_date"],
+                "status": row["status"],
+                "charity_name": row["charity__name"],
+                "donations_count": row["completed_donations_count"],
+                "progress_percentage": row["progress_pct"],
+                "created_at": row["created_at"],
+            }
+            for row in rows
+        ]
+        return Response(data)
     
     def perform_create(self, serializer):
         """Create campaign and register it on the blockchain"""
         try:
-            with transaction.atomic():
-                # Save campaign to database first
-                campaign = serializer.save()
+            # Register on blockchain first (only if blockchain is configured),
+            # so the row is inserted once, already carrying its on-chain fields
+            blockchain_fields = {}
+            if blockchain_service.is_configured:
+                data = serializer.validated_data
+                charity = Charity.objects.only("on_chain_id").get(pk=data["charity_id"])
                 
-                # Check if blockchain is configured and charity has on_chain_id
-                from apps.on_chain.blockchain_service import blockchain_service
-                if blockchain_service.is_configured and not campaign.charity.on_chain_id:
+                # Check the charity has an on_chain_id
+                if not charity.on_chain_id:
                     raise ValueError("Charity must be registered on blockchain before creating campaigns")
                 
-                # Register on blockchain (only if blockchain is configured)
-                if blockchain_service.is_configured:
-                    try:
-                        # Convert goal amount to wei (assuming USD, 1 USD = 1 ETH for simplicity)
-                        from web3 import Web3
-                        goal_amount_wei = Web3.to_wei(float(campaign.goal_amount), 'ether')
-                        
-                        # Convert timestamps
-                        start_timestamp = int(campaign.start_date.timestamp())
-                        end_timestamp = int(campaign.end_date.timestamp())
-                        
-                        on_chain_id, tx_hash = blockchain_service.create_campaign_on_chain(
-                            charity_on_chain_id=campaign.charity.on_chain_id,
-                            title=campaign.title,
-                            description=campaign.description,
-                            goal_amount_wei=goal_amount_wei,
-                            start_timestamp=start_timestamp,
-                            end_timestamp=end_timestamp
-                        )
-                        
-                        # Update campaign with blockchain data
-                        campaign.on_chain_id = on_chain_id
-                        campaign.transaction_hash = tx_hash
-                        campaign.save(update_fields=['on_chain_id', 'transaction_hash'])
-                        
-                        logger.info(f"Campaign {campaign.id} created on blockchain with ID {on_chain_id}")
-                        
-                    except BlockchainServiceError as e:
-                        logger.error(f"Failed to create campaign on blockchain: {str(e)}")
-                        # Rollback database transaction if blockchain fails
-                        raise Exception(f"Blockchain campaign creation failed: {str(e)}")
-                else:
-                    logger.info(f"Campaign {campaign.id} created without blockchain integration (blockchain not configured)")
+                try:
+                    # Convert goal amount to wei (assuming USD, 1 USD = 1 ETH for simplicity)
+                    goal_amount_wei = Web3.to_wei(data["goal_amount"], 'ether')
+                    
+                    # Convert timestamps
+                    start_timestamp = int(data["start_date"].timestamp())
+                    end_timestamp = int(data["end_date"].timestamp())
+                    
+                    on_chain_id, tx_hash = blockchain_service.create_campaign_on_chain(
+                        charity_on_chain_id=charity.on_chain_id,
+                        title=data["title"],
+                        description=data["description"],
+                        goal_amount_wei=goal_amount_wei,
+                        start_timestamp=start_timestamp,
+                        end_timestamp=end_timestamp
+                    )
+                    
+                except BlockchainServiceError as e:
+                    logger.error(f"Failed to create campaign on blockchain: {str(e)}")
+                    # Nothing has been written to the database yet
+                    raise Exception(f"Blockchain campaign creation failed: {str(e)}")
+                
+                blockchain_fields = {"on_chain_id": on_chain_id, "transaction_hash": tx_hash}
+            
+            try:
+                with transaction.atomic():
+                    campaign = serializer.save(**blockchain_fields)
+            except Exception:
+                if blockchain_fields:
+                    # Leave enough in the log to reconcile the on-chain record
+                    logger.error(
+                        "Campaign created on blockchain with ID %s (TX %s) but not saved",
+                        blockchain_fields["on_chain_id"],
+                        blockchain_fields["transaction_hash"],
+                    )
+                raise
+            
+            if blockchain_fields:
+                logger.info(f"Campaign {campaign.id} created on blockchain with ID {campaign.on_chain_id}")
+            else:
+                logger.info(f"Campaign {campaign.id} created without blockchain integration (blockchain not configured)")
                     
         except Exception as e:
             logger.error(f"Failed to create campaign: {str(e)}")
@@ -214,19 +484,36 @@ class CampaignViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter campaigns based on query parameters"""
-        queryset = super().get_queryset()
+        queryset = annotate_campaign_progress(super().get_queryset())
+        if self.action in ("retrieve", "utilization"):
+            # Allocation totals come from Campaign.total_allocated_amount; the
+            # events count is a correlated subquery so it doesn't multiply
+            # the donations join behind completed_donations_count
+            queryset = queryset.annotate(
+                _events_count=Coalesce(
+                    Subquery(
+                        CampaignEvent.objects.filter(campaign=OuterRef("pk"))
+                        .order_by()
+                        .values("campaign")
+                        .annotate(count=Count("pk"))
+                        .values("count")
+                    ),
+                    0,
+                )
+            )
+        if self.action == "retrieve":
+            queryset = queryset.prefetch_related(recent_donations_prefetch())
+        if self.action == "list":
+            queryset = queryset.defer("description", "charity__description").annotate(
+                description_excerpt=Substr(
+                    "description", 1, CAMPAIGN_LIST_DESCRIPTION_LENGTH
+                )
+            )
 
         # Filter by status
         status = self.request.query_params.get("status", None)
-        if status:
-            if status == "active":
-                queryset = queryset.filter(status="ACTIVE")
-            elif status == "upcoming":
-                queryset = queryset.filter(status="UPCOMING")
-            elif status == "ended":
-                queryset = queryset.filter(status="ENDED")
-            elif status == "completed":
-                queryset = queryset.filter(status="COMPLETED")
+        if status in CAMPAIGN_STATUS_FILTERS:
+            queryset = queryset.filter(status=CAMPAIGN_STATUS_FILTERS[status])
 
         # Filter by fundraising progress
         progress = self.request.query_params.get("progress", None)
@@ -238,26 +525,65 @@ class CampaignViewSet(viewsets.ModelViewSet):
 
         return queryset
 
-    @action(detail=True, methods=["get"])
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=StandardPagination,
+        renderer_classes=LIST_RENDERER_CLASSES,
+    )
     def donations(self, request, pk=None):
         """Get all donations for a specific campaign"""
         campaign = self.get_object()
-        donations = campaign.donations.all().select_related("user", "token")
+        donations = campaign.donations.select_related("user", "token").order_by(
+            "-donation_timestamp"
+        )
+        page = self.paginate_queryset(donations)
         serializer = DonationSerializer(
-            donations, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+    def _record_donation_on_chain(self, donation, campaign):
+        """Send a committed donation to the campaign contract and store the TX hash"""
+        try:
+            # Calculate proportional ETH amount: $100 = 0.001 ETH, kept in
+            # Decimal/int so cents and wei aren't rounded through a float
+            eth_amount = donation.amount * DONATION_ETH_PER_USD
+            amount_wei = int(donation.amount * DONATION_WEI_PER_USD)
+            actual_amount_usd_cents = int(donation.amount * 100)  # Convert to cents
+            
+            tx_hash = blockchain_service.donate_native_on_chain(
+                campaign_on_chain_id=campaign.on_chain_id,
+                amount_wei=amount_wei,
+                actual_amount_usd=actual_amount_usd_cents
+            )
+            
+            # Update donation with transaction hash and token quantity. A plain
+            # UPDATE: neither field affects the campaign totals the post_save
+            # receivers maintain
+            donation.transaction_hash = tx_hash
+            donation.token_quantity = eth_amount  # Proportional ETH amount sent to blockchain
+            Donation.objects.filter(pk=donation.pk).update(
+                transaction_hash=tx_hash, token_quantity=eth_amount
+            )
+            
+            logger.info(f"Donation {donation.id} recorded on blockchain with TX {tx_hash}")
+            
+        except Exception as e:
+            # The donation is already committed; it stays without an on-chain record
+            logger.error(f"Failed to record donation on blockchain: {str(e)}")
 
     @action(detail=True, methods=["post"])
     def donate(self, request, pk=None):
         """Make a donation to a specific campaign"""
         campaign = self.get_object()
+        now = timezone.now()
         
         # Ensure campaign status is up to date before checking if donations are allowed
-        campaign.update_status()
+        campaign.update_status(now)
         
         serializer = DonationCreateSerializer(
-            data=request.data, context={"request": request}
+            data=request.data, context={"request": request, "now": now}
         )
 
         if serializer.is_valid():
@@ -268,51 +594,24 @@ class CampaignViewSet(viewsets.ModelViewSet):
                     donation = serializer.save()
                     
                     # Record donation on blockchain (only if blockchain is configured)
-                    from apps.on_chain.blockchain_service import blockchain_service
                     if blockchain_service.is_configured:
-                        try:
-                            if not campaign.on_chain_id:
-                                raise ValueError("Campaign must be registered on blockchain before accepting donations")
-                            
-                            # Calculate proportional ETH amount: $100 = 0.001 ETH
-                            from web3 import Web3
-                            donation_amount_usd = float(donation.amount)
-                            eth_amount = (donation_amount_usd / 100.0) * 0.001  # Scale: $100 = 0.001 ETH
-                            amount_wei = Web3.to_wei(eth_amount, 'ether')
-                            actual_amount_usd_cents = int(donation_amount_usd * 100)  # Convert to cents
-                            
-                            # Use user's wallet address if available, otherwise use admin wallet
-                            donor_address = getattr(request.user, 'wallet_address', None)
-                            if not donor_address:
-                                from django.conf import settings
-                                donor_address = getattr(settings, 'ADMIN_WALLET_ADDRESS', '')
-                            
-                            tx_hash = blockchain_service.donate_native_on_chain(
-                                campaign_on_chain_id=campaign.on_chain_id,
-                                amount_wei=amount_wei,
-                                actual_amount_usd=actual_amount_usd_cents
-                            )
-                            
-                            # Update donation with transaction hash and token quantity
-                            donation.transaction_hash = tx_hash
-                            donation.token_quantity = eth_amount  # Proportional ETH amount sent to blockchain
-                            donation.save(update_fields=['transaction_hash', 'token_quantity'])
-                            
-                            logger.info(f"Donation {donation.id} recorded on blockchain with TX {tx_hash}")
-                            
-                        except BlockchainServiceError as e:
-                            logger.error(f"Failed to record donation on blockchain: {str(e)}")
-                            # Don't rollback database - donation exists but not on blockchain
+                        if not campaign.on_chain_id:
+                            raise ValueError("Campaign must be registered on blockchain before accepting donations")
+                        # The RPC can take seconds, so it runs once the donation is
+                        # committed rather than holding the transaction open
+                        transaction.on_commit(
+                            lambda: self._record_donation_on_chain(donation, campaign)
+                        )
                     else:
                         logger.info(f"Donation {donation.id} recorded without blockchain integration (blockchain not configured)")
                     
                     # Campaign raised amount will be updated automatically by Django signals
                     # No need to manually update it here
-                    
-                    response_serializer = DonationSerializer(
-                        donation, context={"request": request}
-                    )
-                    return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+                
+                response_serializer = DonationSerializer(
+                    donation, context={"request": request}
+                )
+                return Response(response_serializer.data, status=status.HTTP_201_CREATED)
                     
             except Exception as e:
                 logger.error(f"Failed to process donation: {str(e)}")
@@ -327,25 +626,26 @@ class CampaignViewSet(viewsets.ModelViewSet):
     def statistics(self, request, pk=None):
         """Get statistics for a specific campaign"""
         campaign = self.get_object()
-        
-        # Ensure campaign status is up to date
-        campaign.update_status()
+        now = timezone.now()
 
-        completed_donations = campaign.donations.filter(status=DonationStatus.COMPLETED)
-        total_donations = completed_donations.count()
-        unique_donors = completed_donations.values("user").distinct().count()
+        donation_totals = campaign.donations.filter(
+            status=DonationStatus.COMPLETED
+        ).aggregate(
+            total_donations=Count("id"),
+            unique_donors=Count("user", distinct=True),
+        )
+        total_donations = donation_totals["total_donations"]
+        unique_donors = donation_totals["unique_donors"]
 
         progress_percentage = 0
         if campaign.goal_amount > 0:
-            progress_percentage = round(
-                (float(campaign.raised_amount) / float(campaign.goal_amount)) * 100, 2
+            progress_percentage = float(
+                round(campaign.raised_amount * 100 / campaign.goal_amount, 2)
             )
 
-        # Use the campaign's status field instead of calculating
-        campaign_status = campaign.status.lower()
-
-        from django.utils import timezone
-        now = timezone.now()
+        # Report the up-to-date status without writing it back on a GET;
+        # donations and the scheduled command persist status changes
+        campaign_status = campaign.compute_status(now).lower()
 
         stats = {
             "total_donations": total_donations,
@@ -361,7 +661,12 @@ class CampaignViewSet(viewsets.ModelViewSet):
 
         return Response(stats)
 
-    @action(detail=True, methods=["get"])
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=StandardPagination,
+        renderer_classes=LIST_RENDERER_CLASSES,
+    )
     def events(self, request, pk=None):
         """Get all events for a specific campaign"""
         campaign = self.get_object()
@@ -373,11 +678,14 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        events = campaign.events.all().select_related("created_by")
+        events = annotate_created_by_name(
+            campaign.events.only(*CAMPAIGN_EVENT_LIST_FIELDS)
+        )
+        page = self.paginate_queryset(events)
         serializer = CampaignEventListSerializer(
-            events, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=True, methods=["post"])
     def allocate_funds(self, request, pk=None):
@@ -429,12 +737,14 @@ class CampaignViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def utilization(self, request, pk=None):
         """Get fund utilization metrics for a specific campaign"""
+        # The events count is annotated by get_queryset and the allocation
+        # figures derive from columns on the row, so this is one query
         campaign = self.get_object()
         
         total_allocated = CampaignEvent.get_total_allocated_for_campaign(campaign)
         remaining_funds = CampaignEvent.get_remaining_funds_for_campaign(campaign)
         utilization_percentage = CampaignEvent.get_utilization_percentage_for_campaign(campaign)
-        events_count = campaign.events.count()
+        events_count = campaign._events_count
         
         data = {
             "total_allocated": float(total_allocated),
@@ -449,9 +759,6 @@ class CampaignViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def all_transactions(self, request):
         """Get all blockchain transactions from donations, campaign events, etc."""
-        from django.db.models import Q
-        from .models import Donation, CampaignEvent
-        from apps.on_chain.models import OnChainTransaction
         
         # Get query parameters
         search = request.query_params.get('search', '')
@@ -460,24 +767,13 @@ class CampaignViewSet(viewsets.ModelViewSet):
         address_filter = request.query_params.get('address', '')
         ordering = request.query_params.get('ordering', '-created_at')
         
-        # Build base querysets
-        charities = Charity.objects.filter(
-            transaction_hash__isnull=False
-        )
-        
-        campaigns = Campaign.objects.filter(
-            transaction_hash__isnull=False
-        ).select_related('charity')
-        
-        donations = Donation.objects.filter(
-            transaction_hash__isnull=False
-        ).select_related('campaign', 'campaign__charity', 'user')
-        
-        campaign_events = CampaignEvent.objects.filter(
-            transaction_hash__isnull=False
-        ).select_related('campaign', 'campaign__charity', 'created_by')
-        
-        on_chain_transactions = OnChainTransaction.objects.all().select_related('token', 'token__charity')
+        # Build base querysets; related names are joined in by the values()
+        # projections below, so no select_related is needed
+        charities = Charity.objects.filter(transaction_hash__isnull=False)
+        campaigns = Campaign.objects.filter(transaction_hash__isnull=False)
+        donations = Donation.objects.filter(transaction_hash__isnull=False)
+        campaign_events = CampaignEvent.objects.filter(transaction_hash__isnull=False)
+        on_chain_transactions = OnChainTransaction.objects.all()
         
         # Apply filters
         if search:
@@ -521,123 +817,118 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 Q(to_address__icontains=address_filter)
             )
         
-        # Convert to unified format
-        transactions = []
-        
-        # Add charity registrations
-        for charity in charities:
-            transactions.append({
-                'id': f"charity_{charity.id}",
-                'type': 'charity_registration',
-                'transaction_hash': charity.transaction_hash,
-                'amount': 0,
-                'token_quantity': 0,
-                'from_address': 'Admin',
-                'to_address': 'Blockchain',
-                'charity_name': charity.name,
-                'campaign_title': '',
-                'user_email': 'admin@system.com',  # Default admin email since no created_by field
-                'timestamp': charity.created_at,
-                'status': 'COMPLETED',
-                'explorer_url': charity.charity_explorer_url,
-            })
-        
-        # Add campaign creations
-        for campaign in campaigns:
-            transactions.append({
-                'id': f"campaign_{campaign.id}",
-                'type': 'campaign_creation',
-                'transaction_hash': campaign.transaction_hash,
-                'amount': float(campaign.goal_amount),
-                'token_quantity': 0,
-                'from_address': 'Admin',
-                'to_address': 'Blockchain',
-                'charity_name': campaign.charity.name,
-                'campaign_title': campaign.title,
-                'user_email': 'admin@system.com',  # Default admin email since no created_by field
-                'timestamp': campaign.created_at,
-                'status': 'COMPLETED',
-                'explorer_url': campaign.campaign_explorer_url,
-            })
-        
-        # Add donations
-        for donation in donations:
-            transactions.append({
-                'id': f"donation_{donation.id}",
-                'type': 'donation',
-                'transaction_hash': donation.transaction_hash,
-                'amount': float(donation.amount) if donation.amount else 0,
-                'token_quantity': float(donation.token_quantity) if donation.token_quantity else 0,
-                'from_address': getattr(donation.user, 'wallet_address', ''),
-                'to_address': 'Campaign',
-                'charity_name': donation.campaign.charity.name,
-                'campaign_title': donation.campaign.title,
-                'user_email': donation.user.email if donation.user else '',
-                'timestamp': donation.donation_timestamp or donation.created_at,
-                'status': donation.status,
-                'explorer_url': donation.donation_explorer_url,
-            })
-        
-        # Add campaign events
-        for event in campaign_events:
-            transactions.append({
-                'id': f"event_{event.id}",
-                'type': 'campaign_event',
-                'transaction_hash': event.transaction_hash,
-                'amount': float(event.amount),
-                'token_quantity': 0,
-                'from_address': 'Campaign',
-                'to_address': 'Event',
-                'charity_name': event.campaign.charity.name,
-                'campaign_title': event.campaign.title,
-                'user_email': event.created_by.email if event.created_by else '',
-                'timestamp': event.created_at,
-                'status': event.status,
-                'explorer_url': event.event_explorer_url,
-                'event_title': event.title,
-            })
-        
-        # Add on-chain transactions
-        for tx in on_chain_transactions:
-            transactions.append({
-                'id': f"onchain_{tx.id}",
-                'type': 'on_chain',
-                'transaction_hash': tx.transaction_hash,
-                'amount': float(tx.amount),
-                'token_quantity': float(tx.amount),
-                'from_address': tx.from_address,
-                'to_address': tx.to_address,
-                'charity_name': tx.token.charity.name,
-                'campaign_title': '',
-                'user_email': '',
-                'timestamp': tx.timestamp,
-                'status': 'COMPLETED',
-                'explorer_url': f"https://sepolia.etherscan.io/tx/{tx.transaction_hash}",
-                'token_name': tx.token.name,
-            })
-        
-        # Sort transactions
-        if ordering.startswith('-'):
-            field = ordering[1:]
-            reverse = True
-        else:
-            field = ordering
-            reverse = False
-        
-        transactions.sort(key=lambda x: x.get(field, ''), reverse=reverse)
-        
+        # Project each source onto the same columns and let the database
+        # sort and slice the UNION, so only one page of rows is fetched
+        zero = Value(0, output_field=DecimalField())
+        admin = {
+            "from_address": _text("Admin"),
+            "to_address": _text("Blockchain"),
+            "user_email": _text("admin@system.com"),  # No created_by field
+            "status": _text("COMPLETED"),
+        }
+        rows = _transaction_rows(
+            charities,
+            "charity_registration",
+            "charity",
+            transaction_hash=F("transaction_hash"),
+            amount=zero,
+            token_quantity=zero,
+            charity_name=F("name"),
+            timestamp=F("created_at"),
+            **admin,
+        ).union(
+            _transaction_rows(
+                campaigns,
+                "campaign_creation",
+                "campaign",
+                transaction_hash=F("transaction_hash"),
+                amount=F("goal_amount"),
+                token_quantity=zero,
+                charity_name=F("charity__name"),
+                campaign_title=F("title"),
+                timestamp=F("created_at"),
+                **admin,
+            ),
+            _transaction_rows(
+                donations,
+                "donation",
+                "donation",
+                transaction_hash=F("transaction_hash"),
+                amount=Coalesce("amount", zero),
+                token_quantity=Coalesce("token_quantity", zero),
+                from_address=Coalesce(
+                    "user__wallet_address", _text(""), output_field=CharField()
+                ),
+                to_address=_text("Campaign"),
+                charity_name=F("campaign__charity__name"),
+                campaign_title=F("campaign__title"),
+                user_email=Coalesce("user__email", _text(""), output_field=CharField()),
+                timestamp=Coalesce("donation_timestamp", "created_at"),
+                status=F("status"),
+            ),
+            _transaction_rows(
+                campaign_events,
+                "campaign_event",
+                "event",
+                transaction_hash=F("transaction_hash"),
+                amount=F("amount"),
+                token_quantity=zero,
+                from_address=_text("Campaign"),
+                to_address=_text("Event"),
+                charity_name=F("campaign__charity__name"),
+                campaign_title=F("campaign__title"),
+                user_email=Coalesce(
+                    "created_by__email", _text(""), output_field=CharField()
+                ),
+                timestamp=F("created_at"),
+                status=F("status"),
+                event_title=F("title"),
+            ),
+            _transaction_rows(
+                on_chain_transactions,
+                "on_chain",
+                "onchain",
+                transaction_hash=F("transaction_hash"),
+                amount=F("amount"),
+                token_quantity=F("amount"),
+                from_address=F("from_address"),
+                to_address=F("to_address"),
+                charity_name=F("token__charity__name"),
+                timestamp=F("timestamp"),
+                status=_text("COMPLETED"),
+                token_name=F("token__name"),
+            ),
+            all=True,
+        )
+
+        # Sort on any unified column; "created_at" is the timestamp column
+        field = ordering.lstrip('-')
+        if field == 'created_at':
+            field = 'timestamp'
+        if field not in TRANSACTION_COLUMNS:
+            field = 'timestamp'
+        prefix = '-' if ordering.startswith('-') else ''
+        rows = rows.order_by(f"{prefix}tx_{field}", "tx_id")
+
         # Pagination
         page_size = 20
-        start = (int(request.query_params.get('page', 1)) - 1) * page_size
+        # Clamp to the first page; a zero or negative page would slice with a
+        # negative offset, which querysets reject
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        start = (page - 1) * page_size
         end = start + page_size
-        
-        paginated_transactions = transactions[start:end]
+
+        count = rows.count()
+        paginated_transactions = [_unified_transaction(row) for row in rows[start:end]]
         
         return Response({
             'results': paginated_transactions,
-            'count': len(transactions),
-            'next': f"?page={int(request.query_params.get('page', 1)) + 1}" if end < len(transactions) else None,
-            'previous': f"?page={int(request.query_params.get('page', 1)) - 1}" if int(request.query_params.get('page', 1)) > 1 else None,
+            'count': count,
+            'next': f"?page={page + 1}" if end < count else None,
+            'previous': f"?page={page - 1}" if page > 1 else None,
         })
 
 
@@ -649,6 +940,7 @@ class DonationViewSet(viewsets.ModelViewSet):
 
     serializer_class = DonationSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = LIST_RENDERER_CLASSES
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["campaign__title", "campaign__charity__name"]
     ordering_fields = ["amount", "token_quantity", "donation_timestamp", "created_at"]
@@ -680,33 +972,22 @@ class DonationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def my_statistics(self, request):
         """Get donation statistics for the current user"""
-        user_donations = self.get_queryset().filter(status=DonationStatus.COMPLETED)
-
-        total_donations = user_donations.count()
-        total_amount = user_donations.aggregate(total=Sum("amount"))["total"] or 0
-
-        campaigns_supported = user_donations.values("campaign").distinct().count()
-        charities_supported = (
-            user_donations.values("campaign__charity").distinct().count()
+        totals = self.get_queryset().filter(status=DonationStatus.COMPLETED).aggregate(
+            total_donations=Count("id"),
+            total_amount=Sum("amount"),
+            campaigns_supported=Count("campaign", distinct=True),
+            charities_supported=Count("campaign__charity", distinct=True),
+            first_donation=Min("donation_timestamp"),
+            latest_donation=Max("donation_timestamp"),
         )
 
         stats = {
-            "total_donations": total_donations,
-            "total_amount_donated": float(total_amount),
-            "campaigns_supported": campaigns_supported,
-            "charities_supported": charities_supported,
-            "first_donation": (
-                user_donations.order_by("donation_timestamp").first().donation_timestamp
-                if user_donations.exists()
-                else None
-            ),
-            "latest_donation": (
-                user_donations.order_by("-donation_timestamp")
-                .first()
-                .donation_timestamp
-                if user_donations.exists()
-                else None
-            ),
+            "total_donations": totals["total_donations"],
+            "total_amount_donated": float(totals["total_amount"] or 0),
+            "campaigns_supported": totals["campaigns_supported"],
+            "charities_supported": totals["charities_supported"],
+            "first_donation": totals["first_donation"],
+            "latest_donation": totals["latest_donation"],
         }
 
         return Response(stats)
@@ -725,11 +1006,22 @@ class CampaignEventViewSet(viewsets.ModelViewSet):
     ordering_fields = ["amount", "event_date", "created_at"]
     ordering = ["-event_date"]
 
+    # Built once and shared by every request and thread, so these permission
+    # classes must stay stateless: no attributes set in has_permission() or
+    # has_object_permission()
+    _write_permissions = (IsAuthenticated(), IsCharityManager())
+    _read_permissions = (IsAuthenticatedOrReadOnly(),)
+
     def get_queryset(self):
         """Filter events based on campaign and permissions"""
-        queryset = CampaignEvent.objects.all().select_related(
-            "campaign", "campaign__charity", "created_by"
-        )
+        queryset = annotate_created_by_name(CampaignEvent.objects.all())
+        if self.action == "list":
+            queryset = queryset.only(*CAMPAIGN_EVENT_LIST_FIELDS)
+        else:
+            # The list serializer reads no campaign or creator columns
+            queryset = queryset.select_related(
+                "campaign", "campaign__charity", "created_by"
+            )
 
         # Filter by campaign if provided
         campaign_id = self.request.query_params.get("campaign")
@@ -757,13 +1049,11 @@ class CampaignEventViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         """
-        Instantiates and returns the list of permissions that this view requires.
+        Return the shared permission instances that this view requires.
         """
-        if self.action in ["create", "update", "partial_update", "destroy"]:
-            permission_classes = [IsAuthenticated]
-        else:
-            permission_classes = [IsAuthenticatedOrReadOnly]
-        return [permission() for permission in permission_classes]
+        if self.action in WRITE_ACTIONS:
+            return self._write_permissions
+        return self._read_permissions
 
     def create(self, request, *args, **kwargs):
         """Override create to add campaign context"""
@@ -774,21 +1064,18 @@ class CampaignEventViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            campaign = Campaign.objects.get(id=campaign_id)
-        except Campaign.DoesNotExist:
+        # Only the columns read by validation and CampaignEvent.save()
+        campaign = (
+            Campaign.objects.only("id", "status", "raised_amount", "total_allocated_amount")
+            .filter(id=campaign_id)
+            .first()
+        )
+        if campaign is None:
             return Response(
                 {"error": "Campaign not found"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Check if user is charity manager
-        if request.user.role != "CHARITY_MANAGER":
-            return Response(
-                {"error": "Only charity managers can create campaign events"}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-
         # Check if campaign is completed or ended
         if campaign.status not in ["COMPLETED", "ENDED"]:
             return Response(
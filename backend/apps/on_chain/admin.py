@@ -1,4 +1,8 @@
+from decimal import Decimal
+
 from django.contrib import admin
+from django.db.models import Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
@@ -33,6 +37,17 @@ class TokenAdmin(admin.ModelAdmin):
         ("System", {"fields": ("id",), "classes": ("collapse",)}),
     )
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _total_volume=Coalesce(
+                    Sum("transactions__amount"), Value(Decimal("0"))
+                ),
+            )
+        )
+
     def charity_link(self, obj):
         url = reverse("admin:charity_charity_change", args=[obj.charity.id])
         return format_html('<a href="{}">{}</a>', url, obj.charity.name)
@@ -49,10 +64,10 @@ class TokenAdmin(admin.ModelAdmin):
     transactions_count.short_description = "Transactions"
 
     def total_volume(self, obj):
-        total = sum([tx.amount for tx in obj.transactions.all()])
-        return f"{total:,.8f} tokens"
+        return f"{obj._total_volume:,.8f} tokens"
 
     total_volume.short_description = "Total Volume"
+    total_volume.admin_order_field = "_total_volume"
 
 
 @admin.register(OnChainTransaction)
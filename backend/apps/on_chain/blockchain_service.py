@@ -23,6 +23,11 @@ class BlockchainServiceError(Exception):
     pass
 
 
+class TransactionNotSentError(BlockchainServiceError):
+    """Raised when a transaction failed before it was broadcast, so it is safe to resend"""
+    pass
+
+
 class BlockchainService:
     """Service class for blockchain interactions"""
     
@@ -120,10 +125,27 @@ class BlockchainService:
             # Estimate gas
             transaction['gas'] = self._estimate_gas(transaction)
             
-            # Sign and send transaction
+            # Sign transaction
             signed_txn = self.w3.eth.account.sign_transaction(transaction, self.admin_account.key)
+        except ContractLogicError as e:
+            logger.error(f"Contract logic error: {str(e)}")
+            raise BlockchainServiceError(f"Contract execution failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Transaction not sent: {str(e)}")
+            raise TransactionNotSentError(f"Transaction not sent: {str(e)}")
+        
+        try:
             tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            
+        except Exception as e:
+            # A timed out send may still have reached the node; only report it
+            # as unsent (and so safe to resend) if the node doesn't know it
+            tx_hash = signed_txn.hash
+            if not self._transaction_known(tx_hash):
+                logger.error(f"Transaction not sent: {str(e)}")
+                raise TransactionNotSentError(f"Transaction not sent: {str(e)}")
+            logger.warning(f"Send reported an error but 0x{tx_hash.hex()} is known: {str(e)}")
+        
+        try:
             # Wait for transaction receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
             
@@ -140,6 +162,16 @@ class BlockchainService:
             logger.error(f"Transaction failed: {str(e)}")
             raise BlockchainServiceError(f"Transaction failed: {str(e)}")
     
+    def _transaction_known(self, tx_hash) -> bool:
+        """Whether the node has seen ``tx_hash``; raises if that can't be determined"""
+        try:
+            self.w3.eth.get_transaction(tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
+        except Exception as e:
+            raise BlockchainServiceError(f"Could not check transaction 0x{tx_hash.hex()}: {str(e)}")
+    
     def register_charity_on_chain(self, name: str, metadata_uri: str, wallet_address: str) -> Tuple[int, str]:
         """
         Register a charity on the blockchain
@@ -336,6 +368,8 @@ class BlockchainService:
             logger.info(f"Campaign event created on-chain: TX={tx_hash}")
             return tx_hash
             
+        except TransactionNotSentError:
+            raise
         except Exception as e:
             logger.error(f"Failed to create campaign event on-chain: {str(e)}")
             raise BlockchainServiceError(f"Campaign event creation failed: {str(e)}")
@@ -1,5 +1,17 @@
 from rest_framework.permissions import BasePermission
 
+from .models import Roles
+
 class AnonWriteOnly(BasePermission):
     def has_permission(self, request, view):
-        return request.method == 'POST'
\ No newline at end of file
+        return request.method == 'POST'
+
+
+class IsCharityManager(BasePermission):
+    message = "Only charity managers can perform this action."
+
+    def has_permission(self, request, view):
+        return (
+            request.user.is_authenticated
+            and getattr(request.user, "role", None) == Roles.CHARITY_MANAGER
+        )
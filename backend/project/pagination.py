@@ -0,0 +1,9 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class StandardPagination(PageNumberPagination):
+    """Page-number pagination for the nested list actions"""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 200
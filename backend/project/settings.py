@@ -234,6 +234,10 @@ ADMIN_WALLET_ADDRESS = os.getenv("ADMIN_WALLET_ADDRESS", "")
 ADMIN_WALLET_PRIVATE_KEY = os.getenv("ADMIN_WALLET_PRIVATE_KEY", "")
 BLOCKCHAIN_EXPLORER_BASE_URL = "https://sepolia.etherscan.io"
 
+# Celery; without a broker, tasks run inline as before
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "")
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+
 # import sys
 # LOGGING = {
 #     'version': 1,
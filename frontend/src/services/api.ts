@@ -22,6 +22,9 @@ import {
   CampaignUtilization,
 } from '../types';
 
+// Largest page the API's StandardPagination serves
+const MAX_PAGE_SIZE = 200;
+
 class ApiService {
   private api: AxiosInstance;
   private token: string | null = null;
@@ -187,18 +190,27 @@ class ApiService {
     await this.api.delete(`/charities/${id}/`);
   }
 
+  // Nested list endpoints are paginated; walk every page so long lists aren't truncated
+  private async getAllPages<T>(url: string): Promise<T[]> {
+    const results: T[] = [];
+    let next: string | undefined = url;
+    let params: { page_size: number } | undefined = { page_size: MAX_PAGE_SIZE };
+    while (next) {
+      const response: AxiosResponse<PaginatedResponse<T>> = await this.api.get(next, { params });
+      results.push(...response.data.results);
+      // `next` already carries the page and page_size query parameters
+      next = response.data.next || undefined;
+      params = undefined;
+    }
+    return results;
+  }
+
   async getCharityCampaigns(id: string): Promise<CampaignList[]> {
-    const response: AxiosResponse<CampaignList[]> = await this.api.get(
-      `/charities/${id}/campaigns/`
-    );
-    return response.data;
+    return this.getAllPages<CampaignList>(`/charities/${id}/campaigns/`);
   }
 
   async getCharityDonations(id: string): Promise<Donation[]> {
-    const response: AxiosResponse<Donation[]> = await this.api.get(
-      `/charities/${id}/donations/`
-    );
-    return response.data;
+    return this.getAllPages<Donation>(`/charities/${id}/donations/`);
   }
 
   async getCharityStats(id: string): Promise<CharityStats> {
@@ -253,10 +265,7 @@ class ApiService {
   }
 
   async getCampaignDonations(id: string): Promise<Donation[]> {
-    const response: AxiosResponse<Donation[]> = await this.api.get(
-      `/campaigns/${id}/donations/`
-    );
-    return response.data;
+    return this.getAllPages<Donation>(`/campaigns/${id}/donations/`);
   }
 
   async donateToCampaign(id: string, donation: DonationCreate): Promise<Donation> {
@@ -414,10 +423,7 @@ class ApiService {
 
   // Campaign Events API methods
   async getCampaignEvents(campaignId: string): Promise<CampaignEvent[]> {
-    const response: AxiosResponse<CampaignEvent[]> = await this.api.get(
-      `/campaigns/${campaignId}/events/`
-    );
-    return response.data;
+    return this.getAllPages<CampaignEvent>(`/campaigns/${campaignId}/events/`);
   }
 
   async createCampaignEvent(campaignId: string, data: FormData): Promise<CampaignEvent> {